@@ -20,6 +20,7 @@ from company_valuation.sotp import SOTPModel, Segment
 from company_valuation.sensitivity import SensitivityAnalysis
 from company_valuation.utils import (
     treasury_stock_method,
+    treasury_stock_method_arrays,
     diluted_shares,
     enterprise_value,
     equity_value_from_ev,
@@ -49,6 +50,7 @@ __all__ = [
     "Segment",
     "SensitivityAnalysis",
     "treasury_stock_method",
+    "treasury_stock_method_arrays",
     "diluted_shares",
     "enterprise_value",
     "equity_value_from_ev",
@@ -0,0 +1,23 @@
+"""
+Optional Numba support for numeric kernels.
+
+Numba is not a required dependency. When it is installed, kernels decorated
+with ``njit`` are compiled to machine code; otherwise the decorator returns
+the plain Python function so results are identical, only slower.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
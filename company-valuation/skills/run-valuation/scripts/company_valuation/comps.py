@@ -8,13 +8,17 @@ This module implements:
 - Peer group statistics
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
-from company_valuation.utils import filter_valid_values, calculate_statistics
+import numpy as np
 
+from company_valuation.utils import (
+    _ratio, _statistics_rows, calculate_statistics
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class PeerCompany:
     """
     Comparable peer company data.
@@ -186,21 +190,193 @@ class PeerCompany:
         return None
 
 
+# Numeric peer columns accepted by ComparableAnalysis.from_columns()
+_REQUIRED_PEER_COLUMNS = ("price", "shares_outstanding", "net_debt")
+_PEER_COLUMNS = _REQUIRED_PEER_COLUMNS + (
+    "ltm_revenue", "ltm_ebitda", "ltm_ebit", "ltm_net_income", "book_value",
+    "ntm_revenue", "ntm_ebitda", "ntm_eps",
+)
+
+# implied_value() multiple type -> (LTM column, NTM column)
+_IMPLIED_COLUMNS = {
+    "ev_ebitda": ("_ev_ebitda", "_ev_ebitda_ntm"),
+    "ev_ebit": ("_ev_ebit", "_ev_ebit"),
+    "ev_revenue": ("_ev_revenue", "_ev_revenue_ntm"),
+    "pe": ("_pe", "_pe_ntm"),
+}
+
+
 @dataclass
 class ComparableAnalysis:
     """
     Comparable Company Analysis for a peer group.
 
     Calculates and summarizes valuation multiples across peer companies.
+
+    Peer multiples are extracted into columns once at construction, so
+    the peers list and its PeerCompany objects should not be modified
+    afterwards; build a new analysis for a changed peer group.
     """
     peers: list[PeerCompany]
+    _tickers: list[str] = field(init=False, repr=False, compare=False)
+    _ev_ebitda: np.ndarray = field(init=False, repr=False, compare=False)
+    _ev_ebitda_ntm: np.ndarray = field(init=False, repr=False, compare=False)
+    _ev_ebit: np.ndarray = field(init=False, repr=False, compare=False)
+    _ev_revenue: np.ndarray = field(init=False, repr=False, compare=False)
+    _ev_revenue_ntm: np.ndarray = field(init=False, repr=False, compare=False)
+    _pe: np.ndarray = field(init=False, repr=False, compare=False)
+    _pe_ntm: np.ndarray = field(init=False, repr=False, compare=False)
+    _price_to_book: np.ndarray = field(init=False, repr=False, compare=False)
+    _stats_cache: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Extract peer columns once and compute all multiples."""
+        def column(values) -> np.ndarray:
+            # None becomes NaN under a float dtype
+            return np.array(list(values), dtype=np.float64)
+
+        peers = self.peers
+        self._set_columns({
+            "ticker": [p.ticker for p in peers],
+            "price": column(p.price for p in peers),
+            "shares_outstanding": column(p.shares_outstanding for p in peers),
+            "net_debt": column(p.net_debt for p in peers),
+            "ltm_revenue": column(p.get_ltm_revenue() for p in peers),
+            "ltm_ebitda": column(p.get_ltm_ebitda() for p in peers),
+            "ltm_ebit": column(p.get_ltm_ebit() for p in peers),
+            "ltm_net_income": column(p.get_ltm_net_income() for p in peers),
+            "book_value": column(p.book_value for p in peers),
+            "ntm_revenue": column(p.ntm_revenue for p in peers),
+            "ntm_ebitda": column(p.ntm_ebitda for p in peers),
+            "ntm_eps": column(p.ntm_eps for p in peers),
+        })
+
+    def _set_columns(self, columns: dict) -> None:
+        """
+        Compute every multiple from per-peer float64 columns.
+
+        Args:
+            columns: Ticker list plus one array per column in
+                _PEER_COLUMNS, with NaN for missing values
+        """
+        self._tickers = list(columns["ticker"])
+        price = columns["price"]
+        shares = columns["shares_outstanding"]
+        market_cap = price * shares
+        ev = market_cap + columns["net_debt"]
+
+        ltm_revenue = columns["ltm_revenue"]
+        ltm_ebitda = columns["ltm_ebitda"]
+        ltm_ebit = columns["ltm_ebit"]
+        ltm_eps = _ratio(columns["ltm_net_income"], shares, shares > 0)
+        book = columns["book_value"]
+
+        def prefer(ntm: np.ndarray, ltm: np.ndarray) -> np.ndarray:
+            # NTM estimate where present and non-zero, else LTM
+            return np.where(~np.isnan(ntm) & (ntm != 0), ntm, ltm)
+
+        ntm_revenue = prefer(columns["ntm_revenue"], ltm_revenue)
+        ntm_ebitda = prefer(columns["ntm_ebitda"], ltm_ebitda)
+        ntm_eps = prefer(columns["ntm_eps"], ltm_eps)
+
+        self._ev_ebitda = _ratio(ev, ltm_ebitda, ltm_ebitda > 0)
+        self._ev_ebitda_ntm = _ratio(ev, ntm_ebitda, ntm_ebitda > 0)
+        self._ev_ebit = _ratio(ev, ltm_ebit, ltm_ebit > 0)
+        self._ev_revenue = _ratio(ev, ltm_revenue, ltm_revenue > 0)
+        self._ev_revenue_ntm = _ratio(ev, ntm_revenue, ntm_revenue > 0)
+        self._pe = _ratio(price, ltm_eps, ltm_eps > 0)
+        self._pe_ntm = _ratio(price, ntm_eps, ntm_eps > 0)
+        self._price_to_book = _ratio(market_cap, book, book > 0)
+        self._stats_cache = {}
+
+    @classmethod
+    def from_columns(cls, data) -> "ComparableAnalysis":
+        """
+        Create an analysis from column data instead of PeerCompany objects.
+
+        Accepts anything indexable by column name: a pandas DataFrame, a
+        dict of arrays or a NumPy structured array. Multiples are computed
+        directly from the columns; the PeerCompany list is still built so
+        the result behaves like one created from peers.
+
+        Args:
+            data: Columns "ticker", "price", "shares_outstanding" and
+                "net_debt", plus any of "name", "ltm_revenue", "ltm_ebitda",
+                "ltm_ebit", "ltm_net_income", "book_value", "ntm_revenue",
+                "ntm_ebitda" and "ntm_eps". Missing values may be NaN or
+                None; LTM figures must be pre-calculated.
 
-    def _get_statistics(self, values: list[float]) -> dict:
+        Returns:
+            ComparableAnalysis instance
+        """
+        def has(name: str) -> bool:
+            names = getattr(getattr(data, "dtype", None), "names", None)
+            return name in (names if names is not None else data)
+
+        tickers = [str(t) for t in data["ticker"]]
+        n = len(tickers)
+        columns = {"ticker": tickers}
+        for name in _PEER_COLUMNS:
+            if has(name):
+                # None becomes NaN under a float dtype
+                columns[name] = np.array(list(data[name]), dtype=np.float64)
+            elif name in _REQUIRED_PEER_COLUMNS:
+                raise ValueError(f"Missing required column: {name}")
+            else:
+                columns[name] = np.full(n, np.nan)
+
+        names = [str(x) for x in data["name"]] if has("name") else tickers
+        given = [name for name in _PEER_COLUMNS if has(name)]
+        rows = zip(*(columns[name].tolist() for name in given))
+        peers = [
+            PeerCompany(ticker=ticker, name=peer_name, **{
+                # NaN back to None, as PeerCompany expects
+                name: value for name, value in zip(given, row) if value == value
+            })
+            for ticker, peer_name, row in zip(tickers, names, rows)
+        ]
+
+        analysis = object.__new__(cls)
+        analysis.peers = peers
+        analysis._set_columns(columns)
+        return analysis
+
+    def _get_statistics(self, values: np.ndarray) -> dict:
         """Calculate statistics for a list of values, excluding count."""
         stats = calculate_statistics(values)
         stats.pop("count", None)
         return stats
 
+    def _statistics_for(self, multiple_type: str, use_ntm: bool) -> dict:
+        """
+        Statistics for an implied-value multiple, memoized per instance.
+
+        The multiple columns are fixed at construction, so repeated
+        implied_value() calls (e.g. across target metrics) reuse them.
+        """
+        key = (multiple_type, use_ntm)
+        stats = self._stats_cache.get(key)
+        if stats is None:
+            if multiple_type not in _IMPLIED_COLUMNS:
+                raise ValueError(f"Unknown multiple type: {multiple_type}")
+            ltm, ntm = _IMPLIED_COLUMNS[multiple_type]
+            stats = self._get_statistics(getattr(self, ntm if use_ntm else ltm))
+            self._stats_cache[key] = stats
+        return stats
+
+    def _multiples(self, values: np.ndarray,
+                   stats: Optional[dict] = None) -> dict:
+        """Per-peer multiples (None where undefined) with statistics."""
+        multiples = {
+            ticker: None if v != v else v
+            for ticker, v in zip(self._tickers, values.tolist())
+        }
+        if stats is None:
+            stats = self._get_statistics(values)
+        else:
+            stats.pop("count", None)
+        return {"multiples": multiples, "statistics": stats}
+
     def ev_ebitda_multiples(self, use_ntm: bool = False) -> dict:
         """
         Get EV/EBITDA multiples for all peers with statistics.
@@ -211,33 +387,23 @@ class ComparableAnalysis:
         Returns:
             Dictionary with peer multiples and statistics
         """
-        multiples = {p.ticker: p.ev_ebitda(use_ntm) for p in self.peers}
-        valid = filter_valid_values(list(multiples.values()))
-        return {"multiples": multiples, "statistics": self._get_statistics(valid)}
+        return self._multiples(self._ev_ebitda_ntm if use_ntm else self._ev_ebitda)
 
     def ev_ebit_multiples(self) -> dict:
         """Get EV/EBIT multiples for all peers with statistics."""
-        multiples = {p.ticker: p.ev_ebit() for p in self.peers}
-        valid = filter_valid_values(list(multiples.values()))
-        return {"multiples": multiples, "statistics": self._get_statistics(valid)}
+        return self._multiples(self._ev_ebit)
 
     def ev_revenue_multiples(self, use_ntm: bool = False) -> dict:
         """Get EV/Revenue multiples for all peers with statistics."""
-        multiples = {p.ticker: p.ev_revenue(use_ntm) for p in self.peers}
-        valid = filter_valid_values(list(multiples.values()))
-        return {"multiples": multiples, "statistics": self._get_statistics(valid)}
+        return self._multiples(self._ev_revenue_ntm if use_ntm else self._ev_revenue)
 
     def pe_ratios(self, use_ntm: bool = False) -> dict:
         """Get P/E ratios for all peers with statistics."""
-        multiples = {p.ticker: p.pe_ratio(use_ntm) for p in self.peers}
-        valid = filter_valid_values(list(multiples.values()))
-        return {"multiples": multiples, "statistics": self._get_statistics(valid)}
+        return self._multiples(self._pe_ntm if use_ntm else self._pe)
 
     def price_to_book_ratios(self) -> dict:
         """Get P/BV ratios for all peers with statistics."""
-        multiples = {p.ticker: p.price_to_book() for p in self.peers}
-        valid = filter_valid_values(list(multiples.values()))
-        return {"multiples": multiples, "statistics": self._get_statistics(valid)}
+        return self._multiples(self._price_to_book)
 
     def implied_value(self, target_metric: float, multiple_type: str = "ev_ebitda",
                       use_median: bool = True, use_ntm: bool = False) -> dict:
@@ -253,18 +419,7 @@ class ComparableAnalysis:
         Returns:
             Dictionary with implied value and range (25th-75th percentile)
         """
-        if multiple_type == "ev_ebitda":
-            data = self.ev_ebitda_multiples(use_ntm)
-        elif multiple_type == "ev_ebit":
-            data = self.ev_ebit_multiples()
-        elif multiple_type == "ev_revenue":
-            data = self.ev_revenue_multiples(use_ntm)
-        elif multiple_type == "pe":
-            data = self.pe_ratios(use_ntm)
-        else:
-            raise ValueError(f"Unknown multiple type: {multiple_type}")
-
-        stats = data["statistics"]
+        stats = self._statistics_for(multiple_type, use_ntm)
         ref_multiple = stats["median"] if use_median else stats["mean"]
 
         if ref_multiple is None:
@@ -293,10 +448,16 @@ class ComparableAnalysis:
         Returns:
             Dictionary with all multiple statistics
         """
+        columns = {
+            "ev_ebitda": self._ev_ebitda_ntm if use_ntm else self._ev_ebitda,
+            "ev_ebit": self._ev_ebit,
+            "ev_revenue": self._ev_revenue_ntm if use_ntm else self._ev_revenue,
+            "pe": self._pe_ntm if use_ntm else self._pe,
+            "price_to_book": self._price_to_book
+        }
+        # Statistics for all five multiples in one batched sort
+        stats = _statistics_rows(np.vstack(list(columns.values())))
         return {
-            "ev_ebitda": self.ev_ebitda_multiples(use_ntm),
-            "ev_ebit": self.ev_ebit_multiples(),
-            "ev_revenue": self.ev_revenue_multiples(use_ntm),
-            "pe": self.pe_ratios(use_ntm),
-            "price_to_book": self.price_to_book_ratios()
+            name: self._multiples(values, row_stats)
+            for (name, values), row_stats in zip(columns.items(), stats)
         }
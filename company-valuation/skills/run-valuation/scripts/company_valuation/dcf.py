@@ -9,11 +9,18 @@ This module implements:
 - Enterprise Value to Equity Value bridge
 """
 
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+from company_valuation._jit import njit, prange
+from company_valuation.utils import _year_index
+
+
+@dataclass(slots=True)
 class UFCFProjection:
     """
     Single period UFCF (Unlevered Free Cash Flow) projection.
@@ -34,6 +41,9 @@ class UFCFProjection:
         sbc: Stock-based compensation (if tracking separately)
         add_back_sbc: Whether to add back SBC (sell-side convention)
         ebitda: EBITDA for exit multiple terminal value (optional)
+
+    NOPAT and UFCF are computed once at construction, so the inputs
+    should not be modified afterwards.
     """
     year: int
     revenue: float
@@ -45,30 +55,34 @@ class UFCFProjection:
     sbc: float = 0.0
     add_back_sbc: bool = False
     ebitda: Optional[float] = None
+    _nopat: float = field(init=False, repr=False, compare=False)
+    _ufcf: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Set EBITDA if not provided and cache NOPAT and UFCF."""
+        if self.ebitda is None:
+            self.ebitda = self.ebit + self.depreciation_amortization
+        self._nopat = self.ebit * (1 - self.tax_rate)
+        fcf = (self._nopat
+               + self.depreciation_amortization
+               - self.capex
+               - self.delta_nwc)
+        if self.add_back_sbc:
+            fcf += self.sbc
+        self._ufcf = fcf
 
     @property
     def nopat(self) -> float:
         """Net Operating Profit After Tax."""
-        return self.ebit * (1 - self.tax_rate)
+        return self._nopat
 
     @property
     def ufcf(self) -> float:
         """Calculate Unlevered Free Cash Flow."""
-        fcf = (self.nopat
-               + self.depreciation_amortization
-               - self.capex
-               - self.delta_nwc)
-        if self.add_back_sbc:
-            fcf += self.sbc
-        return fcf
-
-    def __post_init__(self):
-        """Set EBITDA if not provided."""
-        if self.ebitda is None:
-            self.ebitda = self.ebit + self.depreciation_amortization
+        return self._ufcf
 
 
-@dataclass
+@dataclass(slots=True)
 class DCFResult:
     """Result of DCF valuation."""
     pv_explicit_cashflows: float
@@ -81,7 +95,89 @@ class DCFResult:
     implied_perpetual_growth: Optional[float] = None
 
 
-@dataclass
+@njit(cache=True)
+def _discount_periods(n, stub_fraction, mid_year_convention):
+    """
+    Discount period of each projection year given stub and mid-year settings.
+
+    The first period covers the stub; later periods are whole years.
+    """
+    periods = np.empty(n)
+    for i in range(n):
+        if i == 0:
+            base_period = stub_fraction
+            mid_year_adjustment = stub_fraction / 2
+        else:
+            base_period = stub_fraction + i
+            mid_year_adjustment = 0.5
+
+        if mid_year_convention:
+            periods[i] = base_period - mid_year_adjustment
+        else:
+            periods[i] = base_period
+    return periods
+
+
+@lru_cache(maxsize=128)
+def _shared_discount_periods(n: int, stub_fraction: float,
+                             mid_year_convention: bool) -> np.ndarray:
+    """
+    Read-only discount periods, cached by (n, stub, mid-year).
+
+    A full first year without mid-year discounting is just years 1..n, so
+    the shared year index is returned as is. The cache is bounded so that
+    sweeps over many stub fractions do not grow it without limit.
+    """
+    if stub_fraction == 1.0 and not mid_year_convention:
+        return _year_index(n)
+    periods = _discount_periods(n, stub_fraction, mid_year_convention)
+    periods.flags.writeable = False
+    return periods
+
+
+# Lazily typed: the shared discount periods are read-only arrays, which an
+# eager float64[:] signature would reject
+@njit(cache=True)
+def _dcf_core(ufcf, periods, wacc, g, terminal_period):
+    """
+    Numeric core of the perpetuity growth DCF.
+
+    Args:
+        ufcf: UFCF by projection year
+        periods: Discount period for each UFCF
+        wacc: Discount rate
+        g: Terminal growth rate
+        terminal_period: Discount period of the terminal value
+
+    Returns:
+        Tuple of (PV of explicit UFCF, terminal value, PV of terminal value)
+    """
+    # Scalar loop rather than np.dot: Numba lowers np.dot to BLAS, which
+    # needs SciPy, and the loop allocates no temporaries. Factors are
+    # exp(-log1p(wacc) * t), which avoids a general pow per period.
+    log_discount = math.log1p(wacc)
+    pv = 0.0
+    for i in range(ufcf.shape[0]):
+        pv += ufcf[i] * math.exp(-log_discount * periods[i])
+    tv = ufcf[ufcf.shape[0] - 1] * (1.0 + g) / (wacc - g)
+    return pv, tv, tv * math.exp(-log_discount * terminal_period)
+
+
+@njit(parallel=True, cache=True)
+def _dcf_scenarios(ufcf, wacc, g, stub, mid_year_convention, out):
+    """Fill out[s] with the perpetuity growth EV at (wacc[s], g[s], stub[s])."""
+    n = ufcf.shape[0]
+    for s in prange(wacc.shape[0]):
+        if wacc[s] <= g[s]:
+            out[s] = np.nan
+            continue
+        periods = _discount_periods(n, stub[s], mid_year_convention)
+        terminal_period = stub[s] + (n - 1)
+        pv, _, pv_tv = _dcf_core(ufcf, periods, wacc[s], g[s], terminal_period)
+        out[s] = pv + pv_tv
+
+
+@dataclass(slots=True)
 class DCFModel:
     """
     Institutional DCF Model.
@@ -102,6 +198,13 @@ class DCFModel:
         shares_outstanding: Diluted shares for per-share value
         mid_year_convention: Whether to use mid-year discounting
         stub_fraction: Fraction of first year if starting mid-period
+        precision: "fast" sums discounted cash flows in floating point;
+            "exact" uses math.fsum for a correctly rounded total, at some
+            cost per call
+
+    Projection cash flows are packed into arrays once at construction, so
+    the projections list should not be modified afterwards. Rates and
+    terminal assumptions may still be changed, or overridden per call.
     """
     projections: list[UFCFProjection]
     wacc: float
@@ -111,6 +214,38 @@ class DCFModel:
     shares_outstanding: Optional[float] = None
     mid_year_convention: bool = True
     stub_fraction: float = 1.0  # 1.0 = full year, 0.5 = half year stub
+    precision: str = "fast"
+    _proj_array: np.ndarray = field(init=False, repr=False, compare=False)
+    _ufcf: np.ndarray = field(init=False, repr=False, compare=False)
+    _factors_cache: Optional[tuple] = field(init=False, repr=False,
+                                            compare=False)
+
+    def __post_init__(self):
+        """
+        Pack projections into a (N, 7) array and compute UFCF in one pass.
+
+        Columns: revenue, ebit, tax_rate, D&A, capex, delta_nwc, and SBC
+        added back (0 when add_back_sbc is False).
+        """
+        if self.precision not in ("fast", "exact"):
+            raise ValueError(f"Unknown precision: {self.precision}")
+        if not self.projections:
+            raise ValueError("At least one projection is required")
+        if self.wacc <= -1:
+            raise ValueError(f"WACC ({self.wacc:.2%}) must be greater than -100%")
+        self._proj_array = np.array(
+            [(p.revenue, p.ebit, p.tax_rate, p.depreciation_amortization,
+              p.capex, p.delta_nwc, p.sbc if p.add_back_sbc else 0.0)
+             for p in self.projections],
+            dtype=np.float64
+        ).reshape(-1, 7)
+        _, ebit, tax_rate, da, capex, delta_nwc, sbc = self._proj_array.T
+        self._ufcf = ebit * (1 - tax_rate) + da - capex - delta_nwc + sbc
+        self._factors_cache = None
+
+    def _ufcf_vec(self) -> np.ndarray:
+        """UFCF for each projection year."""
+        return self._ufcf
 
     def _get_discount_periods(self) -> list[float]:
         """
@@ -119,26 +254,17 @@ class DCFModel:
         Returns:
             List of discount periods for each projection year
         """
-        periods = []
-        for i in range(len(self.projections)):
-            if i == 0:
-                base_period = self.stub_fraction
-                mid_year_adjustment = self.stub_fraction / 2
-            else:
-                base_period = self.stub_fraction + i
-                mid_year_adjustment = 0.5
+        return self._periods().tolist()
 
-            if self.mid_year_convention:
-                period = base_period - mid_year_adjustment
-            else:
-                period = base_period
-
-            periods.append(period)
-        return periods
+    def _periods(self) -> np.ndarray:
+        """Discount periods as a shared read-only array."""
+        return _shared_discount_periods(len(self.projections),
+                                        float(self.stub_fraction),
+                                        bool(self.mid_year_convention))
 
     def _discount_factor(self, period: float) -> float:
         """Calculate discount factor for a given period."""
-        return 1 / ((1 + self.wacc) ** period)
+        return math.exp(-math.log1p(self.wacc) * period)
 
     def calculate_pv_explicit(self) -> tuple[float, list[float]]:
         """
@@ -147,15 +273,50 @@ class DCFModel:
         Returns:
             Tuple of (total PV, list of discounted cash flows)
         """
-        periods = self._get_discount_periods()
-        discounted_cfs = []
+        discounted = self._ufcf_vec() * self._discount_factors()
+        pv_list = discounted.tolist()
+        if self.precision == "exact":
+            return math.fsum(pv_list), pv_list
+        return float(discounted.sum()), pv_list
 
-        for proj, period in zip(self.projections, periods):
-            df = self._discount_factor(period)
-            discounted_cf = proj.ufcf * df
-            discounted_cfs.append(discounted_cf)
+    def _discount_factors(self, wacc: Optional[float] = None) -> np.ndarray:
+        """
+        Discount factor for each projection year (at self.wacc by default).
 
-        return sum(discounted_cfs), discounted_cfs
+        The last result is kept as a read-only array keyed by WACC and the
+        shared periods array, so repeated valuations at the same inputs
+        reuse it while a changed WACC, stub or convention recomputes.
+        """
+        if wacc is None:
+            wacc = self.wacc
+        periods = self._periods()
+        cached = self._factors_cache
+        if cached is not None and cached[0] == wacc and cached[1] is periods:
+            return cached[2]
+        factors = np.exp(-math.log1p(wacc) * periods)
+        factors.flags.writeable = False
+        self._factors_cache = (wacc, periods, factors)
+        return factors
+
+    def _pv_explicit_total(self, wacc: Optional[float] = None) -> float:
+        """Total PV of explicit UFCF as a single dot product."""
+        factors = self._discount_factors(wacc)
+        if self.precision == "exact":
+            return math.fsum((self._ufcf_vec() * factors).tolist())
+        return float(np.dot(self._ufcf_vec(), factors))
+
+    def _check_terminal_growth(self, wacc: Optional[float] = None,
+                               terminal_growth: Optional[float] = None):
+        """Raise if the perpetuity growth model is undefined (WACC <= g)."""
+        if wacc is None:
+            wacc = self.wacc
+        if terminal_growth is None:
+            terminal_growth = self.terminal_growth
+        if wacc <= terminal_growth:
+            raise ValueError(
+                f"Terminal growth ({terminal_growth:.2%}) must be less than "
+                f"WACC ({wacc:.2%})"
+            )
 
     def calculate_terminal_value_perpetuity(self) -> float:
         """
@@ -166,13 +327,9 @@ class DCFModel:
         Returns:
             Terminal value (undiscounted)
         """
-        if self.wacc <= self.terminal_growth:
-            raise ValueError(
-                f"Terminal growth ({self.terminal_growth:.2%}) must be less than "
-                f"WACC ({self.wacc:.2%})"
-            )
+        self._check_terminal_growth()
 
-        final_ufcf = self.projections[-1].ufcf
+        final_ufcf = float(self._ufcf_vec()[-1])
         tv = final_ufcf * (1 + self.terminal_growth) / (self.wacc - self.terminal_growth)
         return tv
 
@@ -205,7 +362,7 @@ class DCFModel:
         Returns:
             Implied perpetual growth rate
         """
-        final_ufcf = self.projections[-1].ufcf
+        final_ufcf = float(self._ufcf_vec()[-1])
         ufcf_next = final_ufcf * (1 + self.terminal_growth)  # Proxy using terminal_growth
 
         # Derived from Gordon Growth: TV = UFCF × (1+g) / (WACC - g)
@@ -220,21 +377,85 @@ class DCFModel:
 
         TV is always discounted from end of period n (not mid-year).
         """
-        n = len(self.projections)
-        # For stub periods, adjust the terminal discount period
-        terminal_period = self.stub_fraction + (n - 1) if self.stub_fraction < 1 else n
-        return tv * self._discount_factor(terminal_period)
+        return tv * self._discount_factor(self._terminal_period())
+
+    def _terminal_period(self) -> float:
+        """Discount period of the terminal value (end of final year)."""
+        # The first period spans the stub and later ones whole years, so the
+        # final year ends at stub + (n - 1); with no stub this is n.
+        return self.stub_fraction + (len(self.projections) - 1)
+
+    def _perpetuity_components(
+        self, wacc: Optional[float] = None,
+        terminal_growth: Optional[float] = None
+    ) -> tuple[float, float, float]:
+        """
+        PV of explicit UFCF, terminal value and PV of terminal value.
 
-    def value_perpetuity_method(self) -> DCFResult:
+        Overrides apply to this call only; the model is not modified.
+
+        Raises:
+            ValueError: If WACC <= terminal growth
+        """
+        if wacc is None:
+            wacc = self.wacc
+        if terminal_growth is None:
+            terminal_growth = self.terminal_growth
+        self._check_terminal_growth(wacc, terminal_growth)
+        pv_explicit, tv, pv_tv = (
+            float(x) for x in _dcf_core(
+                self._ufcf_vec(),
+                self._periods(),
+                float(wacc), float(terminal_growth),
+                float(self._terminal_period())
+            )
+        )
+        if self.precision == "exact":
+            pv_explicit = self._pv_explicit_total(wacc)
+        return pv_explicit, tv, pv_tv
+
+    def enterprise_value_perpetuity(
+        self, *, wacc: Optional[float] = None,
+        terminal_growth: Optional[float] = None
+    ) -> float:
+        """
+        Perpetuity growth enterprise value only.
+
+        Same figure as value_perpetuity_method().enterprise_value without
+        building the DCFResult, for callers that revalue in a loop.
+
+        Args:
+            wacc: WACC for this call (default: self.wacc)
+            terminal_growth: Terminal growth for this call
+                (default: self.terminal_growth)
+
+        Returns:
+            Enterprise value
+        """
+        pv_explicit, _, pv_tv = self._perpetuity_components(wacc,
+                                                            terminal_growth)
+        return pv_explicit + pv_tv
+
+    def value_perpetuity_method(
+        self, *, wacc: Optional[float] = None,
+        terminal_growth: Optional[float] = None
+    ) -> DCFResult:
         """
         Calculate DCF value using perpetuity growth method.
 
+        Overrides let callers value alternative scenarios without mutating
+        the model, so one instance can be shared across threads.
+
+        Args:
+            wacc: WACC for this call (default: self.wacc)
+            terminal_growth: Terminal growth for this call
+                (default: self.terminal_growth)
+
         Returns:
             DCFResult with valuation details
         """
-        pv_explicit, _ = self.calculate_pv_explicit()
-        tv = self.calculate_terminal_value_perpetuity()
-        pv_tv = self._discount_terminal_value(tv)
+        pv_explicit, tv, pv_tv = self._perpetuity_components(wacc,
+                                                            terminal_growth)
 
         ev = pv_explicit + pv_tv
         equity_value = ev - self.net_debt
@@ -253,6 +474,103 @@ class DCFModel:
             terminal_method="perpetuity_growth"
         )
 
+    def sensitivity_grid(self, wacc_range: list[float],
+                         growth_range: list[float],
+                         dtype: np.dtype = np.float64) -> np.ndarray:
+        """
+        Perpetuity growth enterprise value over a WACC × growth grid.
+
+        Computes the whole two-way table in one broadcast instead of
+        re-running value_perpetuity_method() per cell. Cells where
+        WACC <= g are NaN.
+
+        Args:
+            wacc_range: WACC values (rows)
+            growth_range: Terminal growth values (columns)
+            dtype: Working precision; np.float32 halves memory traffic
+                for large grids at about 1e-6 relative error
+
+        Returns:
+            Enterprise values as float64, shape
+            (len(wacc_range), len(growth_range))
+        """
+        w64 = np.asarray(wacc_range, dtype=np.float64)[:, None]
+        g64 = np.asarray(growth_range, dtype=np.float64)[None, :]
+        invalid = np.broadcast_to(w64 <= g64, (w64.shape[0], g64.shape[1]))
+
+        w, g = w64.astype(dtype), g64.astype(dtype)
+        ufcf = self._ufcf_vec().astype(dtype)
+        periods = self._periods().astype(dtype)
+
+        log_discount = np.log1p(w)
+        pv_explicit = np.exp(-log_discount * periods) @ ufcf
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tv = ufcf[-1] * (1 + g) / (w - g)
+        pv_tv = tv * np.exp(-log_discount * self._terminal_period())
+
+        ev = (pv_explicit[:, None] + pv_tv).astype(np.float64)
+        ev[invalid] = np.nan
+        return ev
+
+    def value_many(self, wacc: np.ndarray, terminal_growth: np.ndarray,
+                   stub_fraction: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Perpetuity growth enterprise value for many input scenarios.
+
+        Scenario i uses wacc[i], terminal_growth[i] and stub_fraction[i];
+        all scenarios run in one compiled kernel (in parallel when Numba
+        is installed). Scenarios where WACC <= g are NaN.
+
+        Args:
+            wacc: WACC per scenario
+            terminal_growth: Terminal growth per scenario
+            stub_fraction: Stub fraction per scenario (default: model's)
+
+        Returns:
+            Enterprise value per scenario
+        """
+        wacc = np.atleast_1d(np.asarray(wacc, dtype=np.float64))
+        growth = np.broadcast_to(
+            np.asarray(terminal_growth, dtype=np.float64), wacc.shape
+        ).copy()
+        if stub_fraction is None:
+            stub_fraction = self.stub_fraction
+        stub = np.broadcast_to(
+            np.asarray(stub_fraction, dtype=np.float64), wacc.shape
+        ).copy()
+
+        out = np.empty(wacc.shape[0])
+        _dcf_scenarios(self._ufcf_vec(), wacc, growth, stub,
+                       bool(self.mid_year_convention), out)
+        return out
+
+    @staticmethod
+    def sample_lhs(n: int, wacc_range: tuple[float, float],
+                   growth_range: tuple[float, float],
+                   seed: Optional[int] = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Latin hypercube sample of (WACC, terminal growth) scenarios.
+
+        Each range is split into n equal strata and every stratum is
+        sampled exactly once, with strata paired at random.
+
+        Args:
+            n: Number of scenarios
+            wacc_range: (low, high) WACC bounds
+            growth_range: (low, high) terminal growth bounds
+            seed: Optional random seed
+
+        Returns:
+            Tuple of (wacc, growth) arrays of length n, for value_many()
+        """
+        rng = np.random.default_rng(seed)
+
+        def stratified(low: float, high: float) -> np.ndarray:
+            u = (rng.permutation(n) + rng.random(n)) / n
+            return low + u * (high - low)
+
+        return stratified(*wacc_range), stratified(*growth_range)
+
     def value_exit_multiple_method(self) -> DCFResult:
         """
         Calculate DCF value using exit multiple method.
@@ -263,7 +581,7 @@ class DCFModel:
         if self.exit_multiple is None:
             raise ValueError("Exit multiple not specified")
 
-        pv_explicit, _ = self.calculate_pv_explicit()
+        pv_explicit = self._pv_explicit_total()
         tv = self.calculate_terminal_value_exit_multiple()
         pv_tv = self._discount_terminal_value(tv)
         implied_g = self.calculate_implied_growth_from_multiple(tv)
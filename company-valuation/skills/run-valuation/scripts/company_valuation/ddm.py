@@ -10,11 +10,19 @@ DDM is the standard valuation approach for banks and insurance companies
 where traditional DCF metrics (FCF, working capital) are not meaningful.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+from company_valuation._jit import njit, prange
+from company_valuation.utils import _year_index
+
+# Below this many periods NumPy dispatch costs more than a Python loop
+_VECTORIZE_MIN_PERIODS = 8
+
+
+@dataclass(slots=True)
 class DividendProjection:
     """
     Single period dividend projection.
@@ -36,7 +44,7 @@ class DividendProjection:
             self.dps = self.eps * self.payout_ratio
 
 
-@dataclass
+@dataclass(slots=True)
 class DDMResult:
     """Result of DDM valuation."""
     pv_explicit_dividends: float
@@ -47,7 +55,65 @@ class DDMResult:
     implied_growth_rate: Optional[float] = None
 
 
-@dataclass
+@njit("UniTuple(float64, 3)(float64[:], int32[:], float64, float64)",
+      cache=True)
+def _ddm_core(dps, years, ke, g):
+    """
+    Numeric core of the Gordon Growth DDM.
+
+    Kept as a scalar accumulator loop (no array temporaries) so Numba can
+    compile it to a single tight loop; the explicit signature compiles it
+    at import rather than on first call.
+
+    Args:
+        dps: Dividends per share by projection year
+        years: Projection year for each dividend
+        ke: Cost of equity
+        g: Terminal dividend growth rate
+
+    Returns:
+        Tuple of (PV of dividends, terminal price, PV of terminal price)
+    """
+    n = dps.shape[0]
+    inv = 1.0 / (1.0 + ke)
+    df = 1.0
+    prev_year = 0
+    pv = 0.0
+    for i in range(n):
+        # Consecutive years advance the factor with one multiply; only a
+        # gap or out-of-order year falls back to pow.
+        if years[i] == prev_year + 1:
+            df *= inv
+        else:
+            df = inv ** years[i]
+        prev_year = years[i]
+        pv += dps[i] * df
+    terminal = dps[n - 1] * (1.0 + g) / (ke - g)
+    terminal_df = df if prev_year == n else inv ** n
+    return pv, terminal, terminal * terminal_df
+
+
+@njit(parallel=True, cache=True)
+def _ddm_scenarios(dps, years, ke, g, out):
+    """Fill out[s, k] with the DDM value of dps[s] at (ke[k], g[k])."""
+    for s in prange(dps.shape[0]):
+        for k in range(ke.shape[0]):
+            pv, _, pv_terminal = _ddm_core(dps[s], years, ke[k], g[k])
+            out[s, k] = pv + pv_terminal
+
+
+@njit("float64(float64, float64, float64)", cache=True)
+def _implied_growth_core(terminal_price, final_dps, ke):
+    """Solve P = DPS × (1 + g) / (ke - g) for g; 0 if undefined."""
+    if final_dps == 0.0 or terminal_price == 0.0:
+        return 0.0
+    denominator = terminal_price + final_dps
+    if denominator == 0.0:
+        return 0.0
+    return (terminal_price * ke - final_dps) / denominator
+
+
+@dataclass(slots=True)
 class DDMModel:
     """
     Two-Stage Dividend Discount Model.
@@ -65,15 +131,70 @@ class DDMModel:
         cost_of_equity: Required return on equity (ke)
         terminal_growth: Perpetual dividend growth rate
         terminal_pe: Terminal P/E multiple (alternative to growth)
+
+    Dividends per share are packed into arrays once at construction, so
+    the projections list should not be modified afterwards. The cost of
+    equity and terminal assumptions may still be changed.
     """
     projections: list[DividendProjection]
     cost_of_equity: float
     terminal_growth: float = 0.03
     terminal_pe: Optional[float] = None
+    _years: np.ndarray = field(init=False, repr=False, compare=False)
+    _dps: np.ndarray = field(init=False, repr=False, compare=False)
+    _contiguous: bool = field(init=False, repr=False, compare=False)
+    _constant_growth: Optional[float] = field(init=False, repr=False,
+                                              compare=False)
 
-    def _discount_factor(self, period: int) -> float:
-        """Calculate discount factor for a given period."""
-        return 1 / ((1 + self.cost_of_equity) ** period)
+    def __post_init__(self):
+        """Cache projection years and dividends as arrays for discounting."""
+        if not self.projections:
+            raise ValueError("At least one projection is required")
+        n = len(self.projections)
+        self._years = np.fromiter((p.year for p in self.projections),
+                                  dtype=np.int32, count=n)
+        self._dps = np.fromiter((p.dps for p in self.projections),
+                                dtype=np.float64, count=n)
+        self._contiguous = bool(
+            np.array_equal(self._years, _year_index(n))
+        )
+        self._constant_growth = None
+
+    def _discount_factors(self) -> np.ndarray:
+        """Discount factor for each projection year."""
+        inv = 1.0 / (1.0 + self.cost_of_equity)
+        if self._contiguous:
+            # Years 1..n: a running product instead of n pow calls
+            return np.cumprod(np.full(len(self._years), inv))
+        return np.power(inv, self._years)
+
+    def _discounted_dividends(self) -> tuple[float, list[float], float]:
+        """
+        Discount explicit dividends and return the terminal discount factor.
+
+        The terminal factor is the last year's factor when years run 1..n,
+        so the terminal value is discounted without another pow.
+
+        Returns:
+            Tuple of (total PV, list of discounted dividends,
+            discount factor for year n)
+        """
+        inv = 1.0 / (1.0 + self.cost_of_equity)
+        if len(self._dps) < _VECTORIZE_MIN_PERIODS:
+            factors = [inv ** p.year for p in self.projections]
+            discounted = [p.dps * f for p, f in zip(self.projections, factors)]
+            total = sum(discounted)
+        else:
+            factors = self._discount_factors()
+            discounted_arr = self._dps * factors
+            total = float(discounted_arr.sum())
+            discounted = discounted_arr.tolist()
+
+        if self._contiguous and discounted:
+            terminal_factor = float(factors[-1])
+        else:
+            terminal_factor = inv ** len(self.projections)
+        return total, discounted, terminal_factor
 
     def calculate_pv_dividends(self) -> tuple[float, list[float]]:
         """
@@ -82,13 +203,18 @@ class DDMModel:
         Returns:
             Tuple of (total PV, list of discounted dividends)
         """
-        discounted_divs = []
-        for proj in self.projections:
-            df = self._discount_factor(proj.year)
-            discounted = proj.dps * df
-            discounted_divs.append(discounted)
+        total, discounted, _ = self._discounted_dividends()
+        return total, discounted
 
-        return sum(discounted_divs), discounted_divs
+    def _terminal_spread(self) -> float:
+        """Return ke - g, raising if the Gordon Growth model is undefined."""
+        spread = self.cost_of_equity - self.terminal_growth
+        if spread <= 0:
+            raise ValueError(
+                f"Terminal growth ({self.terminal_growth:.2%}) must be less than "
+                f"cost of equity ({self.cost_of_equity:.2%})"
+            )
+        return spread
 
     def terminal_value_gordon_growth(self) -> float:
         """
@@ -99,15 +225,10 @@ class DDMModel:
         Returns:
             Terminal stock price (undiscounted)
         """
-        if self.cost_of_equity <= self.terminal_growth:
-            raise ValueError(
-                f"Terminal growth ({self.terminal_growth:.2%}) must be less than "
-                f"cost of equity ({self.cost_of_equity:.2%})"
-            )
+        spread = self._terminal_spread()
 
         final_dps = self.projections[-1].dps
-        terminal_dps = final_dps * (1 + self.terminal_growth)
-        return terminal_dps / (self.cost_of_equity - self.terminal_growth)
+        return final_dps * (1 + self.terminal_growth) / spread
 
     def terminal_value_pe_multiple(self) -> float:
         """
@@ -124,11 +245,6 @@ class DDMModel:
         final_eps = self.projections[-1].eps
         return final_eps * self.terminal_pe
 
-    def _discount_terminal_value(self, terminal_price: float) -> float:
-        """Discount terminal stock price to present."""
-        n = len(self.projections)
-        return terminal_price * self._discount_factor(n)
-
     def value_gordon_growth(self) -> DDMResult:
         """
         Calculate equity value using Gordon Growth terminal value.
@@ -136,9 +252,17 @@ class DDMModel:
         Returns:
             DDMResult with valuation details
         """
-        pv_divs, _ = self.calculate_pv_dividends()
-        terminal_price = self.terminal_value_gordon_growth()
-        pv_terminal = self._discount_terminal_value(terminal_price)
+        spread = self._terminal_spread()
+        if self._constant_growth is not None:
+            pv_divs, terminal_price, pv_terminal = self._constant_growth_core(
+                spread
+            )
+        else:
+            pv_divs, terminal_price, pv_terminal = (
+                float(x) for x in _ddm_core(self._dps, self._years,
+                                            self.cost_of_equity,
+                                            self.terminal_growth)
+            )
 
         equity_value = pv_divs + pv_terminal
 
@@ -150,6 +274,33 @@ class DDMModel:
             terminal_method="gordon_growth"
         )
 
+    def _constant_growth_core(self, spread: float) -> tuple[float, float, float]:
+        """
+        Closed-form Gordon Growth DDM for a geometric dividend stream.
+
+        PV = D1 × (1 - ((1 + g) / (1 + ke))^n) / (ke - g), or n × D1 / (1 + ke)
+        when ke == g.
+
+        Args:
+            spread: ke - terminal growth
+
+        Returns:
+            Tuple of (PV of dividends, terminal price, PV of terminal price)
+        """
+        ke = self.cost_of_equity
+        g = self._constant_growth
+        n = len(self._dps)
+        d1 = float(self._dps[0])
+        one_plus_ke = 1.0 + ke
+
+        if ke == g:
+            pv_divs = n * d1 / one_plus_ke
+        else:
+            pv_divs = d1 * (1 - ((1 + g) / one_plus_ke) ** n) / (ke - g)
+
+        terminal_price = float(self._dps[-1]) * (1 + self.terminal_growth) / spread
+        return pv_divs, terminal_price, terminal_price / one_plus_ke ** n
+
     def value_pe_multiple(self) -> DDMResult:
         """
         Calculate equity value using P/E terminal value.
@@ -160,9 +311,9 @@ class DDMModel:
         if self.terminal_pe is None:
             raise ValueError("Terminal P/E not specified")
 
-        pv_divs, _ = self.calculate_pv_dividends()
+        pv_divs, _, terminal_factor = self._discounted_dividends()
         terminal_price = self.terminal_value_pe_multiple()
-        pv_terminal = self._discount_terminal_value(terminal_price)
+        pv_terminal = terminal_price * terminal_factor
 
         equity_value = pv_divs + pv_terminal
 
@@ -184,19 +335,15 @@ class DDMModel:
 
         Given P = DPS × (1+g) / (ke - g), solve for g.
         """
-        final_dps = self.projections[-1].dps
-        if final_dps == 0 or terminal_price == 0:
-            return 0
-
         # From Gordon Growth: P = DPS(1+g)/(ke-g)
         # P(ke-g) = DPS(1+g)
         # Pke - Pg = DPS + DPSg
         # Pke - DPS = Pg + DPSg
         # Pke - DPS = g(P + DPS)
         # g = (Pke - DPS) / (P + DPS)
-        numerator = terminal_price * self.cost_of_equity - final_dps
-        denominator = terminal_price + final_dps
-        return numerator / denominator if denominator != 0 else 0
+        return _implied_growth_core(float(terminal_price),
+                                    float(self.projections[-1].dps),
+                                    float(self.cost_of_equity))
 
     def value(self, method: str = "gordon_growth") -> DDMResult:
         """
@@ -215,6 +362,74 @@ class DDMModel:
         else:
             raise ValueError(f"Unknown method: {method}")
 
+    @staticmethod
+    def value_many(dps: np.ndarray, years: np.ndarray,
+                   cost_of_equity: np.ndarray,
+                   terminal_growth: np.ndarray) -> np.ndarray:
+        """
+        Gordon Growth DDM value per share over a grid of scenarios.
+
+        Values every dividend scenario against every (ke, g) pair in one
+        broadcast, without building a model per cell. Matches
+        value_gordon_growth() for each cell.
+
+        Args:
+            dps: Dividend paths, shape (S, N) or (N,)
+            years: Projection year of each column, shape (N,)
+            cost_of_equity: Cost of equity per pair, shape (K,)
+            terminal_growth: Terminal growth per pair, shape (K,)
+
+        Returns:
+            Equity value per share, shape (S, K)
+        """
+        dps = np.atleast_2d(np.asarray(dps, dtype=np.float64))
+        years = np.asarray(years, dtype=np.float64)
+        ke = np.atleast_1d(np.asarray(cost_of_equity, dtype=np.float64))
+        g = np.atleast_1d(np.asarray(terminal_growth, dtype=np.float64))
+
+        if np.any(ke <= g):
+            raise ValueError("Terminal growth must be less than cost of equity")
+
+        one_plus_ke = (1.0 + ke)[:, None]                   # (K, 1)
+        dfs = one_plus_ke ** -years                         # (K, N)
+        pv_divs = dps @ dfs.T                               # (S, K)
+
+        n = dps.shape[1]
+        terminal = dps[:, -1:] * (1.0 + g) / (ke - g)       # (S, K)
+        pv_terminal = terminal * (1.0 + ke) ** -n
+        return pv_divs + pv_terminal
+
+    @staticmethod
+    def simulate(dps: np.ndarray, years: np.ndarray,
+                 cost_of_equity: np.ndarray,
+                 terminal_growth: np.ndarray) -> np.ndarray:
+        """
+        Gordon Growth DDM value per share for large scenario sets.
+
+        Same inputs and result as value_many(), but evaluated by a compiled
+        kernel that runs scenarios in parallel when Numba is installed.
+
+        Args:
+            dps: Dividend paths, shape (S, N) or (N,)
+            years: Projection year of each column, shape (N,)
+            cost_of_equity: Cost of equity per pair, shape (K,)
+            terminal_growth: Terminal growth per pair, shape (K,)
+
+        Returns:
+            Equity value per share, shape (S, K)
+        """
+        dps = np.ascontiguousarray(np.atleast_2d(dps), dtype=np.float64)
+        years = np.ascontiguousarray(years, dtype=np.int32)
+        ke = np.atleast_1d(np.asarray(cost_of_equity, dtype=np.float64))
+        g = np.atleast_1d(np.asarray(terminal_growth, dtype=np.float64))
+
+        if np.any(ke <= g):
+            raise ValueError("Terminal growth must be less than cost of equity")
+
+        out = np.empty((dps.shape[0], ke.shape[0]))
+        _ddm_scenarios(dps, years, ke, g, out)
+        return out
+
     @classmethod
     def from_eps_forecast(cls, eps_forecasts: list[float],
                           payout_ratio: float,
@@ -237,17 +452,9 @@ class DDMModel:
         Returns:
             DDMModel instance
         """
-        projections = [
-            DividendProjection(year=i+1, eps=eps, payout_ratio=payout_ratio)
-            for i, eps in enumerate(eps_forecasts)
-        ]
-
-        return cls(
-            projections=projections,
-            cost_of_equity=cost_of_equity,
-            terminal_growth=terminal_growth,
-            terminal_pe=terminal_pe
-        )
+        eps = np.asarray(eps_forecasts, dtype=np.float64)
+        return cls._from_arrays(eps, eps * payout_ratio, payout_ratio,
+                                cost_of_equity, terminal_growth, terminal_pe)
 
     @classmethod
     def from_dividend_forecast(cls, dps_forecasts: list[float],
@@ -264,13 +471,71 @@ class DDMModel:
         Returns:
             DDMModel instance
         """
-        projections = [
-            DividendProjection(year=i+1, eps=0, payout_ratio=0, dps=dps)
-            for i, dps in enumerate(dps_forecasts)
-        ]
+        dps = np.asarray(dps_forecasts, dtype=np.float64)
+        return cls._from_arrays(np.zeros_like(dps), dps, 0.0,
+                                cost_of_equity, terminal_growth)
 
-        return cls(
-            projections=projections,
-            cost_of_equity=cost_of_equity,
-            terminal_growth=terminal_growth
-        )
+    @classmethod
+    def from_constant_growth(cls, d1: float, growth: float, years: int,
+                             cost_of_equity: float,
+                             terminal_growth: float = 0.03) -> "DDMModel":
+        """
+        Create DDM model whose explicit dividends grow at a constant rate.
+
+        Dividends are D1, D1 × (1 + g), ..., D1 × (1 + g)^(n-1). The Gordon
+        Growth valuation then uses the growing-annuity closed form instead
+        of discounting each year.
+
+        Args:
+            d1: Dividend in year 1
+            growth: Dividend growth rate over the explicit period
+            years: Number of explicit forecast years
+            cost_of_equity: Required return on equity
+            terminal_growth: Perpetual dividend growth rate
+
+        Returns:
+            DDMModel instance
+
+        Raises:
+            ValueError: If years is less than 1
+        """
+        if years < 1:
+            raise ValueError(f"years ({years}) must be at least 1")
+        dps = d1 * (1 + growth) ** np.arange(years, dtype=np.float64)
+        model = cls._from_arrays(np.zeros_like(dps), dps, 0.0,
+                                 cost_of_equity, terminal_growth)
+        model._constant_growth = growth
+        return model
+
+    @classmethod
+    def _from_arrays(cls, eps: np.ndarray, dps: np.ndarray,
+                     payout_ratio: float, cost_of_equity: float,
+                     terminal_growth: float,
+                     terminal_pe: Optional[float] = None) -> "DDMModel":
+        """
+        Build a model for years 1..n directly from EPS and DPS arrays.
+
+        The cached arrays are taken as given instead of being re-read from
+        the projection objects.
+
+        Raises:
+            ValueError: If there are no dividends
+        """
+        # object.__new__ skips __post_init__, so repeat its check here
+        if len(dps) == 0:
+            raise ValueError("At least one projection is required")
+        model = object.__new__(cls)
+        model.projections = [
+            DividendProjection(year=year, eps=e, payout_ratio=payout_ratio,
+                               dps=d)
+            for year, e, d in zip(range(1, len(dps) + 1), eps.tolist(),
+                                  dps.tolist())
+        ]
+        model.cost_of_equity = cost_of_equity
+        model.terminal_growth = terminal_growth
+        model.terminal_pe = terminal_pe
+        model._years = np.arange(1, len(dps) + 1, dtype=np.int32)
+        model._dps = dps
+        model._contiguous = True
+        model._constant_growth = None
+        return model
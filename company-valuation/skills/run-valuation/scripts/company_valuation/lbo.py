@@ -7,14 +7,18 @@ This module implements:
 - Cash sweep mechanism
 - Revolver logic (draw/repay)
 - IRR and MOIC calculation
-- Circularity resolution through iteration
 """
 
-from dataclasses import dataclass
+import warnings
+from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+from company_valuation._jit import HAS_NUMBA, njit
+
+
+@dataclass(slots=True)
 class DebtTranche:
     """
     Individual debt tranche in the capital structure.
@@ -26,7 +30,8 @@ class DebtTranche:
         amortization_rate: Annual mandatory amortization as % of original (e.g., 0.01 for 1%)
         is_revolver: Whether this is a revolving facility
         revolver_commitment: Total available commitment for revolver
-        cash_sweep_priority: Priority for cash sweep (lower = higher priority)
+        cash_sweep_priority: Priority for cash sweep, or draw/repay order
+            among revolvers (lower = higher priority)
     """
     name: str
     amount: float
@@ -45,7 +50,7 @@ class DebtTranche:
         return balance * self.interest_rate
 
 
-@dataclass
+@dataclass(slots=True)
 class LBOProjection:
     """
     Single year projection for LBO model.
@@ -66,7 +71,7 @@ class LBOProjection:
     depreciation: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LBOResult:
     """Result of LBO analysis."""
     entry_equity: float
@@ -79,7 +84,7 @@ class LBOResult:
     yearly_results: list[dict]
 
 
-@dataclass
+@dataclass(slots=True)
 class SourcesAndUses:
     """Sources and Uses of funds in LBO transaction."""
     # Sources
@@ -114,7 +119,107 @@ class SourcesAndUses:
         return abs(self.total_sources - self.total_uses) < tolerance
 
 
-@dataclass
+@njit(cache=True)
+def _run_lbo_core(ebitda, capex, delta_nwc, tax_rate, depreciation,
+                  amounts, rates, amort_rates, revolver_commitment,
+                  term_index, sweep_order, revolver_order):
+    """
+    Numeric core of the LBO debt schedule.
+
+    Args:
+        ebitda, capex, delta_nwc, tax_rate, depreciation: Per-year
+            projection inputs
+        amounts, rates, amort_rates, revolver_commitment: Per-tranche
+            debt terms, in tranche order
+        term_index: Indices of non-revolver tranches, in tranche order
+        sweep_order: Indices of non-revolver tranches in cash sweep order
+        revolver_order: Indices of revolvers in draw/repay order
+
+    Returns:
+        (years, 6) array with one row per year: interest, fcf, mandatory
+        amortization, cash sweep, revolver change, ending debt
+    """
+    years = len(ebitda)
+    n = len(amounts)
+    balances = amounts.copy()
+    out = np.empty((years, 6))
+
+    for y in range(years):
+        # Interest accrues on opening balances, which are fixed until the
+        # paydowns below, so one pass is exact
+        total_interest = 0.0
+        for i in range(n):
+            total_interest += balances[i] * rates[i]
+
+        # Clamps are written as conditionals: in the interpreted fallback
+        # they skip a builtin call, and compiled they lower to a select.
+        taxable_income = ebitda[y] - depreciation[y] - total_interest
+        taxes = taxable_income * tax_rate[y]
+        taxes = taxes if taxes > 0.0 else 0.0
+        fcf = ebitda[y] - total_interest - taxes - capex[y] - delta_nwc[y]
+
+        # Mandatory amortization
+        mandatory_paydown = 0.0
+        for i in term_index:
+            amort = amounts[i] * amort_rates[i]
+            amort = balances[i] if balances[i] < amort else amort
+            balances[i] -= amort
+            mandatory_paydown += amort
+
+        cash_for_sweep = fcf - mandatory_paydown
+
+        # Cash sweep in priority order
+        sweep_paydown = 0.0
+        if cash_for_sweep > 0:
+            remaining_cash = cash_for_sweep
+            for i in sweep_order:
+                if remaining_cash <= 0:
+                    break
+                paydown = (balances[i] if balances[i] < remaining_cash
+                           else remaining_cash)
+                balances[i] -= paydown
+                sweep_paydown += paydown
+                remaining_cash -= paydown
+
+        # Revolvers cover a shortfall, or are repaid when there was no term
+        # debt to sweep, one facility after another until the cash is used
+        revolver_change = 0.0
+        if cash_for_sweep < 0:
+            needed = -cash_for_sweep
+            for i in revolver_order:
+                if needed <= 0:
+                    break
+                available = revolver_commitment[i] - balances[i]
+                draw = available if available < needed else needed
+                balances[i] += draw
+                revolver_change += draw
+                needed -= draw
+        elif cash_for_sweep > 0 and sweep_paydown == 0:
+            remaining_cash = cash_for_sweep
+            for i in revolver_order:
+                if remaining_cash <= 0:
+                    break
+                repay = (balances[i] if balances[i] < remaining_cash
+                         else remaining_cash)
+                balances[i] -= repay
+                revolver_change -= repay
+                remaining_cash -= repay
+
+        ending_debt = 0.0
+        for i in range(n):
+            ending_debt += balances[i]
+
+        out[y, 0] = total_interest
+        out[y, 1] = fcf
+        out[y, 2] = mandatory_paydown
+        out[y, 3] = sweep_paydown
+        out[y, 4] = revolver_change
+        out[y, 5] = ending_debt
+
+    return out
+
+
+@dataclass(slots=True)
 class LBOModel:
     """
     Institutional LBO Model.
@@ -127,7 +232,6 @@ class LBOModel:
     - Mandatory amortization
     - Cash sweep mechanism
     - Revolver draw/repay logic
-    - Iterative circularity resolution
 
     Attributes:
         entry_ebitda: EBITDA at acquisition
@@ -138,6 +242,9 @@ class LBOModel:
         transaction_fees_pct: Transaction fees as % of EV
         financing_fees_pct: Financing fees as % of debt
         min_cash: Minimum cash to maintain
+
+    Debt tranche terms and projections are flattened for the schedule
+    kernel once at construction, so they should not be modified afterwards.
     """
     entry_ebitda: float
     entry_multiple: float
@@ -147,6 +254,39 @@ class LBOModel:
     transaction_fees_pct: float = 0.02
     financing_fees_pct: float = 0.02
     min_cash: float = 0.0
+    _schedule_inputs: list = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Flatten projections and debt tranches for the schedule kernel."""
+        tranches = self.debt_tranches
+        projections = self.projections
+
+        term_index = [i for i, t in enumerate(tranches) if not t.is_revolver]
+        revolver_index = [i for i, t in enumerate(tranches) if t.is_revolver]
+
+        def by_priority(index: list[int]) -> list[int]:
+            # Stable by priority, then tranche order
+            return sorted(index, key=lambda i: tranches[i].cash_sweep_priority)
+
+        inputs = [
+            [p.ebitda for p in projections],
+            [p.capex for p in projections],
+            [p.delta_nwc for p in projections],
+            [p.tax_rate for p in projections],
+            [p.depreciation for p in projections],
+            [t.amount for t in tranches],
+            [t.interest_rate for t in tranches],
+            [t.amortization_rate for t in tranches],
+            [t.revolver_commitment for t in tranches],
+        ]
+        indices = [term_index, by_priority(term_index),
+                   by_priority(revolver_index)]
+        # Numba needs typed arrays; the interpreted fallback runs faster on
+        # plain Python floats than on NumPy scalars, so keep the lists.
+        if HAS_NUMBA:
+            inputs = [np.array(a, dtype=np.float64) for a in inputs]
+            indices = [np.array(a, dtype=np.int64) for a in indices]
+        self._schedule_inputs = inputs + indices
 
     @property
     def purchase_price(self) -> float:
@@ -174,6 +314,12 @@ class LBOModel:
         return (self.purchase_price + self.transaction_fees +
                 self.financing_fees - self.total_initial_debt)
 
+    def _initial_equity_at(self, entry_multiple):
+        """Sponsor equity check at another entry multiple (scalar or array)."""
+        purchase_price = self.entry_ebitda * entry_multiple
+        return (purchase_price + purchase_price * self.transaction_fees_pct +
+                self.financing_fees - self.total_initial_debt)
+
     def sources_and_uses(self) -> SourcesAndUses:
         """Generate Sources & Uses table."""
         # Separate debt by type
@@ -195,134 +341,82 @@ class LBOModel:
         Calculate free cash flow available for debt paydown.
 
         FCF = EBITDA - Interest - Taxes - CapEx - ΔNWC
-
-        Note: Uses iterative approach since interest depends on debt
-        which depends on paydown which depends on FCF.
         """
         # Calculate taxable income (EBITDA - D&A - Interest)
         taxable_income = proj.ebitda - proj.depreciation - interest_expense
-        taxes = max(0, taxable_income * proj.tax_rate)
+        taxes = taxable_income * proj.tax_rate
+        taxes = taxes if taxes > 0 else 0.0
 
         # FCF available for debt service
         fcf = proj.ebitda - interest_expense - taxes - proj.capex - proj.delta_nwc
         return fcf
 
     def run_model(self, max_iterations: int = 10,
-                  convergence_threshold: float = 0.01) -> LBOResult:
+                  convergence_threshold: float = 0.01, *,
+                  entry_multiple: Optional[float] = None,
+                  exit_multiple: Optional[float] = None) -> LBOResult:
         """
-        Run the LBO model with iterative circularity resolution.
+        Run the LBO model.
 
-        The model has circular reference:
-        Interest → Debt Balance → Paydown → FCF → Interest
-
-        Uses iteration to resolve.
+        Interest is charged on opening debt balances, so each year's
+        interest and FCF are computed in a single pass before that year's
+        paydowns; there is no circularity to iterate on.
 
         Args:
-            max_iterations: Maximum iterations for convergence
-            convergence_threshold: Threshold for convergence check
+            max_iterations: Deprecated and ignored; a non-default value
+                emits a DeprecationWarning
+            convergence_threshold: Deprecated and ignored; a non-default
+                value emits a DeprecationWarning
+            entry_multiple: Entry multiple for this call
+                (default: self.entry_multiple); the model is not modified
+            exit_multiple: Exit multiple for this call
+                (default: self.exit_multiple)
 
         Returns:
             LBOResult with IRR, MOIC, and yearly details
         """
+        if max_iterations != 10 or convergence_threshold != 0.01:
+            warnings.warn(
+                "max_iterations and convergence_threshold are ignored; "
+                "interest is computed without iteration",
+                DeprecationWarning, stacklevel=2
+            )
+        if entry_multiple is None:
+            entry_multiple = self.entry_multiple
+        if exit_multiple is None:
+            exit_multiple = self.exit_multiple
         years = len(self.projections)
+        rows = _run_lbo_core(*self._schedule_inputs).tolist()
 
-        # Initialize debt balances
-        debt_balances = {t.name: t.amount for t in self.debt_tranches}
-        original_amounts = {t.name: t.amount for t in self.debt_tranches}
         yearly_results = []
         total_paydown = 0.0
-
-        for proj in self.projections:
-            # Iterative calculation for this year
-            prev_interest = 0.0
-
-            for iteration in range(max_iterations):
-                # Calculate interest expense
-                total_interest = sum(
-                    t.interest_expense(debt_balances[t.name])
-                    for t in self.debt_tranches
-                )
-
-                # Calculate FCF
-                fcf = self._calculate_free_cash_flow(proj, total_interest)
-
-                # Check convergence
-                if abs(total_interest - prev_interest) < convergence_threshold:
-                    break
-                prev_interest = total_interest
-
-            # Apply mandatory amortization
-            mandatory_paydown = 0.0
-            for t in self.debt_tranches:
-                if not t.is_revolver:
-                    amort = min(t.annual_amortization(original_amounts[t.name]),
-                               debt_balances[t.name])
-                    debt_balances[t.name] -= amort
-                    mandatory_paydown += amort
-
-            # Cash available after mandatory amortization
-            cash_for_sweep = fcf - mandatory_paydown
-
-            # Cash sweep - pay down debt in priority order
-            sweep_paydown = 0.0
-            if cash_for_sweep > 0:
-                # Sort tranches by priority
-                sorted_tranches = sorted(
-                    [t for t in self.debt_tranches if not t.is_revolver],
-                    key=lambda x: x.cash_sweep_priority
-                )
-
-                remaining_cash = cash_for_sweep
-                for t in sorted_tranches:
-                    if remaining_cash <= 0:
-                        break
-                    paydown = min(remaining_cash, debt_balances[t.name])
-                    debt_balances[t.name] -= paydown
-                    sweep_paydown += paydown
-                    remaining_cash -= paydown
-
-            # Handle revolver (draw if FCF negative, repay if positive)
-            revolver_change = 0.0
-            for t in self.debt_tranches:
-                if t.is_revolver:
-                    if cash_for_sweep < 0:
-                        # Draw on revolver
-                        draw = min(-cash_for_sweep,
-                                  t.revolver_commitment - debt_balances[t.name])
-                        debt_balances[t.name] += draw
-                        revolver_change = draw
-                    elif cash_for_sweep > 0 and sweep_paydown == 0:
-                        # Repay revolver if no term debt
-                        repay = min(cash_for_sweep, debt_balances[t.name])
-                        debt_balances[t.name] -= repay
-                        revolver_change = -repay
-
-            year_paydown = mandatory_paydown + sweep_paydown - revolver_change
-            total_paydown += year_paydown
-
+        for proj, (interest, fcf, mandatory_paydown, sweep_paydown,
+                   revolver_change, ending_debt) in zip(self.projections, rows):
+            total_paydown += mandatory_paydown + sweep_paydown - revolver_change
             yearly_results.append({
                 "year": proj.year,
                 "ebitda": proj.ebitda,
-                "interest_expense": total_interest,
+                "interest_expense": interest,
                 "fcf": fcf,
                 "mandatory_amortization": mandatory_paydown,
                 "cash_sweep": sweep_paydown,
                 "revolver_change": revolver_change,
-                "ending_debt": sum(debt_balances.values())
+                "ending_debt": ending_debt
             })
 
         # Exit calculation
         final_ebitda = self.projections[-1].ebitda
-        exit_ev = final_ebitda * self.exit_multiple
-        exit_debt = sum(debt_balances.values())
+        exit_ev = final_ebitda * exit_multiple
+        exit_debt = rows[-1][5]
         exit_equity = exit_ev - exit_debt
 
         # Return calculations
-        moic = exit_equity / self.initial_equity if self.initial_equity > 0 else 0
+        initial_equity = self._initial_equity_at(entry_multiple)
+        moic = exit_equity / initial_equity if initial_equity > 0 else 0
         irr = (moic ** (1 / years)) - 1 if moic > 0 and years > 0 else 0
 
         return LBOResult(
-            entry_equity=self.initial_equity,
+            entry_equity=initial_equity,
             exit_equity=exit_equity,
             moic=moic,
             irr=irr,
@@ -332,6 +426,36 @@ class LBOModel:
             yearly_results=yearly_results
         )
 
+    def irr_grid(self, entry_multiples: list[float],
+                 exit_multiples: list[float]) -> np.ndarray:
+        """
+        IRR over an entry × exit multiple grid.
+
+        Neither multiple affects the debt schedule, so it is run once and
+        the entry equity and exit equity are broadcast over the grid.
+        Matches run_model(entry_multiple=..., exit_multiple=...).irr per cell.
+
+        Args:
+            entry_multiples: Entry EV/EBITDA multiples (rows)
+            exit_multiples: Exit EV/EBITDA multiples (columns)
+
+        Returns:
+            IRR array of shape (len(entry_multiples), len(exit_multiples))
+        """
+        years = len(self.projections)
+        exit_debt = _run_lbo_core(*self._schedule_inputs)[-1, 5]
+        entry_equity = self._initial_equity_at(
+            np.asarray(entry_multiples, dtype=np.float64)
+        )[:, None]
+        exit_equity = (self.projections[-1].ebitda
+                       * np.asarray(exit_multiples, dtype=np.float64)
+                       - exit_debt)[None, :]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            moic = np.where(entry_equity > 0, exit_equity / entry_equity, 0.0)
+            irr = np.where(moic > 0, moic ** (1 / years) - 1, 0.0)
+        return irr
+
     def solve_for_entry_multiple(self, target_irr: float,
                                  min_multiple: float = 5.0,
                                  max_multiple: float = 15.0,
@@ -339,43 +463,51 @@ class LBOModel:
         """
         Solve for maximum entry multiple to achieve target IRR.
 
-        Uses binary search to find the entry multiple that yields
-        the target IRR.
+        Debt is not scaled with the purchase price, so the debt schedule and
+        exit equity do not depend on the entry multiple; only the sponsor
+        equity check does. The model is run once and the equity check that
+        yields the target IRR is inverted for the multiple directly, without
+        modifying the model.
 
-        Note: This method does not scale debt with purchase price. If you need
-        debt to scale proportionally with the entry multiple, create new model
-        instances for each test case.
+        Note: If you need debt to scale proportionally with the entry
+        multiple, create new model instances for each test case.
 
         Args:
             target_irr: Target IRR (e.g., 0.20 for 20%)
             min_multiple: Minimum multiple to consider
             max_multiple: Maximum multiple to consider
-            tolerance: IRR tolerance for convergence
+            tolerance: IRR tolerance for accepting a bound when the exact
+                multiple falls just outside the range
 
         Returns:
             Entry multiple that achieves target IRR, or None if not achievable
         """
-        original_multiple = self.entry_multiple
-        low, high = min_multiple, max_multiple
-
-        try:
-            for _ in range(50):
-                mid = (low + high) / 2
-                self.entry_multiple = mid
+        years = len(self.projections)
+        fee_scale = self.entry_ebitda * (1 + self.transaction_fees_pct)
+        if years == 0 or target_irr <= -1 or fee_scale <= 0:
+            return None
 
-                result = self.run_model()
+        exit_equity = self.run_model().exit_equity
+        if exit_equity <= 0:
+            return None
 
-                if abs(result.irr - target_irr) < tolerance:
-                    return mid
+        # initial_equity = EBITDA × multiple × (1 + fee %) + financing fees - debt
+        required_equity = exit_equity / (1 + target_irr) ** years
+        multiple = (required_equity + self.total_initial_debt
+                    - self.financing_fees) / fee_scale
 
-                if result.irr > target_irr:
-                    low = mid
-                else:
-                    high = mid
+        if min_multiple <= multiple <= max_multiple:
+            return multiple
 
+        # Accept the nearest bound if its IRR is within tolerance of target
+        bound = min(max(multiple, min_multiple), max_multiple)
+        initial_equity = self._initial_equity_at(bound)
+        if initial_equity <= 0:
             return None
-        finally:
-            self.entry_multiple = original_multiple
+        irr = (exit_equity / initial_equity) ** (1 / years) - 1
+        if abs(irr - target_irr) < tolerance:
+            return bound
+        return None
 
     @classmethod
     def simple_lbo(cls, entry_ebitda: float, entry_multiple: float,
@@ -411,17 +543,20 @@ class LBOModel:
             amortization_rate=0.01  # 1% mandatory amortization
         )
 
-        # Create projections
-        projections = []
-        for year in range(1, hold_years + 1):
-            ebitda = entry_ebitda * ((1 + ebitda_growth) ** year)
-            projections.append(LBOProjection(
+        # Create projections, growing EBITDA for all years in one broadcast
+        years = np.arange(1, hold_years + 1)
+        ebitdas = entry_ebitda * np.power(1 + ebitda_growth,
+                                          years.astype(np.float64))
+        projections = [
+            LBOProjection(
                 year=year,
                 ebitda=ebitda,
                 capex=ebitda * capex_pct,
                 tax_rate=tax_rate,
                 depreciation=ebitda * 0.10  # Simplified D&A assumption
-            ))
+            )
+            for year, ebitda in zip(years.tolist(), ebitdas.tolist())
+        ]
 
         return cls(
             entry_ebitda=entry_ebitda,
@@ -7,14 +7,24 @@ This module implements:
 - Time-decay filtering for relevance
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
-from company_valuation.utils import filter_valid_values, calculate_statistics
+import numpy as np
 
+from company_valuation.utils import (_ratio, _statistics_rows,
+                                     calculate_statistics)
 
-@dataclass
+
+def _multiple(value: float, metric: Optional[float]) -> Optional[float]:
+    """Value / metric when the metric is positive, else None."""
+    if metric and metric > 0:
+        return value / metric
+    return None
+
+
+@dataclass(slots=True)
 class Transaction:
     """
     M&A transaction data for precedent analysis.
@@ -36,6 +46,10 @@ class Transaction:
         deal_type: "strategic", "financial", "mixed"
         sector: Industry sector
         geography: Region/country
+
+    Multiples and control premium are computed on access. The announcement
+    date is read once at construction, so it should not be modified
+    afterwards.
     """
     target_name: str
     acquirer_name: str
@@ -57,6 +71,12 @@ class Transaction:
     sector: Optional[str] = None
     geography: Optional[str] = None
 
+    _announce_ord: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Cache the announcement date as an ordinal for recency checks."""
+        self._announce_ord = self.announce_date.toordinal()
+
     @property
     def control_premium(self) -> Optional[float]:
         """
@@ -75,47 +95,188 @@ class Transaction:
     @property
     def ev_revenue(self) -> Optional[float]:
         """EV/Revenue transaction multiple."""
-        if self.target_ltm_revenue and self.target_ltm_revenue > 0:
-            return self.deal_value / self.target_ltm_revenue
-        return None
+        return _multiple(self.deal_value, self.target_ltm_revenue)
 
     @property
     def ev_ebitda(self) -> Optional[float]:
         """EV/EBITDA transaction multiple."""
-        if self.target_ltm_ebitda and self.target_ltm_ebitda > 0:
-            return self.deal_value / self.target_ltm_ebitda
-        return None
+        return _multiple(self.deal_value, self.target_ltm_ebitda)
 
     @property
     def ev_ebit(self) -> Optional[float]:
         """EV/EBIT transaction multiple."""
-        if self.target_ltm_ebit and self.target_ltm_ebit > 0:
-            return self.deal_value / self.target_ltm_ebit
-        return None
+        return _multiple(self.deal_value, self.target_ltm_ebit)
 
     @property
     def pe_ratio(self) -> Optional[float]:
         """P/E based on equity value and net income."""
-        if self.target_ltm_net_income and self.target_ltm_net_income > 0:
-            return self.equity_value / self.target_ltm_net_income
-        return None
+        return _multiple(self.equity_value, self.target_ltm_net_income)
 
     def years_since(self, reference_date: Optional[date] = None) -> float:
         """Calculate years since transaction announcement."""
         ref = reference_date or date.today()
-        delta = ref - self.announce_date
-        return delta.days / 365.25
+        return (ref.toordinal() - self._announce_ord) / 365.25
+
+
+# Per-transaction columns cached on PrecedentAnalysis
+_COLUMNS = ("_announce_ordinals", "_deal_types", "_sectors", "_deal_value",
+            "_ev_revenue", "_ev_ebitda", "_ev_ebit", "_control_premium")
+
+# filter() default for criteria that match by equality, where None is a
+# valid value to match
+_UNSET = object()
+
+# implied_value() multiple type -> cached column
+_MULTIPLE_COLUMNS = {
+    "ev_ebitda": "_ev_ebitda",
+    "ev_ebit": "_ev_ebit",
+    "ev_revenue": "_ev_revenue",
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class PrecedentAnalysis:
     """
     Precedent Transaction Analysis for valuation.
 
     Analyzes historical M&A transactions to derive valuation multiples.
     Includes time-decay filtering to ensure relevance.
+
+    Transaction columns are extracted once at construction, so the
+    transactions list should not be modified afterwards; the filter
+    methods return new analyses instead.
     """
     transactions: list[Transaction]
+    _names: list[str] = field(init=False, repr=False, compare=False)
+    _announce_ordinals: np.ndarray = field(init=False, repr=False, compare=False)
+    _deal_types: np.ndarray = field(init=False, repr=False, compare=False)
+    _sectors: np.ndarray = field(init=False, repr=False, compare=False)
+    _deal_value: np.ndarray = field(init=False, repr=False, compare=False)
+    _ev_revenue: np.ndarray = field(init=False, repr=False, compare=False)
+    _ev_ebitda: np.ndarray = field(init=False, repr=False, compare=False)
+    _ev_ebit: np.ndarray = field(init=False, repr=False, compare=False)
+    _control_premium: np.ndarray = field(init=False, repr=False, compare=False)
+    _stats_cache: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Extract transaction columns once and compute all multiples."""
+        def column(attr: str) -> np.ndarray:
+            # None becomes NaN under a float dtype
+            return np.array([getattr(t, attr) for t in self.transactions],
+                            dtype=np.float64)
+
+        self._names = [t.target_name for t in self.transactions]
+        self._announce_ordinals = np.array(
+            [t._announce_ord for t in self.transactions],
+            dtype=np.int64
+        )
+        self._deal_types = np.array([t.deal_type for t in self.transactions],
+                                    dtype=object)
+        self._sectors = np.array([t.sector for t in self.transactions],
+                                 dtype=object)
+        self._deal_value = deal_value = column("deal_value")
+        revenue = column("target_ltm_revenue")
+        ebitda = column("target_ltm_ebitda")
+        ebit = column("target_ltm_ebit")
+        pre_price = column("pre_announcement_price")
+        deal_price = column("deal_price_per_share")
+
+        self._ev_revenue = _ratio(deal_value, revenue, revenue > 0)
+        self._ev_ebitda = _ratio(deal_value, ebitda, ebitda > 0)
+        self._ev_ebit = _ratio(deal_value, ebit, ebit > 0)
+        self._control_premium = _ratio(
+            deal_price - pre_price, pre_price,
+            (pre_price > 0) & (deal_price != 0) & ~np.isnan(deal_price)
+        )
+        self._stats_cache = {}
+
+    def _take(self, mask: np.ndarray) -> "PrecedentAnalysis":
+        """Subset of rows, sliced from the cached columns."""
+        rows = np.flatnonzero(mask).tolist()
+        subset = object.__new__(PrecedentAnalysis)
+        subset.transactions = [self.transactions[i] for i in rows]
+        subset._names = [self._names[i] for i in rows]
+        for name in _COLUMNS:
+            setattr(subset, name, getattr(self, name)[mask])
+        subset._stats_cache = {}
+        return subset
+
+    def _multiple_statistics(self, multiple_type: str) -> dict:
+        """Statistics of one multiple column, computed once per analysis."""
+        stats = self._stats_cache.get(multiple_type)
+        if stats is None:
+            try:
+                column = _MULTIPLE_COLUMNS[multiple_type]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown multiple type: {multiple_type}"
+                ) from None
+            stats = calculate_statistics(getattr(self, column))
+            self._stats_cache[multiple_type] = stats
+        return stats
+
+    def _multiples(self, values: np.ndarray,
+                   stats: Optional[dict] = None) -> dict:
+        """Per-transaction multiples (None where undefined) with statistics."""
+        multiples = {
+            name: None if v != v else v
+            for name, v in zip(self._names, values.tolist())
+        }
+        if stats is None:
+            stats = calculate_statistics(values)
+        return {"multiples": multiples, "statistics": stats}
+
+    def years_since_array(self, reference_date: Optional[date] = None) -> np.ndarray:
+        """
+        Years since announcement for every transaction.
+
+        Args:
+            reference_date: Date to calculate from (default: today)
+
+        Returns:
+            Array of years, in transaction order
+        """
+        ref = reference_date or date.today()
+        return (ref.toordinal() - self._announce_ordinals) / 365.25
+
+    def filter(self, max_years: Optional[float] = None,
+               reference_date: Optional[date] = None,
+               deal_type: Optional[str] = _UNSET,
+               sector: Optional[str] = _UNSET,
+               min_value: Optional[float] = None,
+               max_value: Optional[float] = None) -> "PrecedentAnalysis":
+        """
+        Filter transactions on several criteria in a single pass.
+
+        Criteria left unset are not applied. deal_type and sector match
+        by equality, so passing None keeps deals with no type or sector.
+
+        Args:
+            max_years: Maximum years since announcement
+            reference_date: Date to calculate recency from (default: today)
+            deal_type: "strategic", "financial", or "mixed"
+            sector: Industry sector
+            min_value: Minimum deal value
+            max_value: Maximum deal value
+
+        Returns:
+            New PrecedentAnalysis with filtered transactions
+        """
+        mask = np.ones(len(self.transactions), dtype=bool)
+        if max_years is not None:
+            # Same float comparison as years_since(), so inf keeps every
+            # deal and NaN keeps none
+            mask &= self.years_since_array(reference_date) <= max_years
+        if deal_type is not _UNSET:
+            mask &= self._deal_types == deal_type
+        if sector is not _UNSET:
+            mask &= self._sectors == sector
+        if min_value is not None:
+            mask &= self._deal_value >= min_value
+        if max_value is not None:
+            mask &= self._deal_value <= max_value
+
+        return self._take(mask)
 
     def filter_by_recency(self, max_years: float = 3.0,
                           reference_date: Optional[date] = None) -> "PrecedentAnalysis":
@@ -132,11 +293,7 @@ class PrecedentAnalysis:
         Returns:
             New PrecedentAnalysis with filtered transactions
         """
-        filtered = [
-            t for t in self.transactions
-            if t.years_since(reference_date) <= max_years
-        ]
-        return PrecedentAnalysis(filtered)
+        return self.filter(max_years=max_years, reference_date=reference_date)
 
     def filter_by_deal_type(self, deal_type: str) -> "PrecedentAnalysis":
         """
@@ -148,13 +305,11 @@ class PrecedentAnalysis:
         Returns:
             New PrecedentAnalysis with filtered transactions
         """
-        filtered = [t for t in self.transactions if t.deal_type == deal_type]
-        return PrecedentAnalysis(filtered)
+        return self.filter(deal_type=deal_type)
 
     def filter_by_sector(self, sector: str) -> "PrecedentAnalysis":
         """Filter transactions by sector."""
-        filtered = [t for t in self.transactions if t.sector == sector]
-        return PrecedentAnalysis(filtered)
+        return self.filter(sector=sector)
 
     def filter_by_size(self, min_value: Optional[float] = None,
                        max_value: Optional[float] = None) -> "PrecedentAnalysis":
@@ -168,14 +323,7 @@ class PrecedentAnalysis:
         Returns:
             New PrecedentAnalysis with filtered transactions
         """
-        filtered = []
-        for t in self.transactions:
-            if min_value is not None and t.deal_value < min_value:
-                continue
-            if max_value is not None and t.deal_value > max_value:
-                continue
-            filtered.append(t)
-        return PrecedentAnalysis(filtered)
+        return self.filter(min_value=min_value, max_value=max_value)
 
     def control_premium_statistics(self) -> dict:
         """
@@ -184,26 +332,19 @@ class PrecedentAnalysis:
         Returns:
             Statistics on control premiums paid
         """
-        premiums = filter_valid_values([t.control_premium for t in self.transactions])
-        return calculate_statistics(premiums)
+        return calculate_statistics(self._control_premium)
 
     def ev_ebitda_multiples(self) -> dict:
         """Get EV/EBITDA transaction multiples with statistics."""
-        multiples = {t.target_name: t.ev_ebitda for t in self.transactions}
-        valid = filter_valid_values(list(multiples.values()))
-        return {"multiples": multiples, "statistics": calculate_statistics(valid)}
+        return self._multiples(self._ev_ebitda)
 
     def ev_ebit_multiples(self) -> dict:
         """Get EV/EBIT transaction multiples with statistics."""
-        multiples = {t.target_name: t.ev_ebit for t in self.transactions}
-        valid = filter_valid_values(list(multiples.values()))
-        return {"multiples": multiples, "statistics": calculate_statistics(valid)}
+        return self._multiples(self._ev_ebit)
 
     def ev_revenue_multiples(self) -> dict:
         """Get EV/Revenue transaction multiples with statistics."""
-        multiples = {t.target_name: t.ev_revenue for t in self.transactions}
-        valid = filter_valid_values(list(multiples.values()))
-        return {"multiples": multiples, "statistics": calculate_statistics(valid)}
+        return self._multiples(self._ev_revenue)
 
     def implied_value(self, target_metric: float, multiple_type: str = "ev_ebitda",
                       use_median: bool = True) -> dict:
@@ -221,16 +362,8 @@ class PrecedentAnalysis:
         Returns:
             Dictionary with implied value and range
         """
-        if multiple_type == "ev_ebitda":
-            data = self.ev_ebitda_multiples()
-        elif multiple_type == "ev_ebit":
-            data = self.ev_ebit_multiples()
-        elif multiple_type == "ev_revenue":
-            data = self.ev_revenue_multiples()
-        else:
-            raise ValueError(f"Unknown multiple type: {multiple_type}")
-
-        stats = data["statistics"]
+        # Only the statistics are needed, not the per-deal multiples dict
+        stats = self._multiple_statistics(multiple_type)
         ref_multiple = stats["median"] if use_median else stats["mean"]
 
         if ref_multiple is None:
@@ -248,6 +381,48 @@ class PrecedentAnalysis:
             "transaction_count": stats["count"]
         }
 
+    def implied_value_batch(self, target_metrics, multiple_type: str = "ev_ebitda",
+                            use_median: bool = True) -> dict:
+        """
+        Implied values for many target metrics at once.
+
+        Same multiples as implied_value, applied to a whole array of
+        metrics (e.g. simulated EBITDA from a Monte Carlo run) in one
+        broadcast multiply. Entries are NaN where implied_value would
+        return None.
+
+        Args:
+            target_metrics: Array of target company metrics
+            multiple_type: "ev_ebitda", "ev_ebit", "ev_revenue"
+            use_median: Use median multiple (vs mean)
+
+        Returns:
+            Dictionary with implied value, low and high arrays
+        """
+        stats = self._multiple_statistics(multiple_type)
+        ref_multiple = stats["median"] if use_median else stats["mean"]
+        metrics = np.asarray(target_metrics, dtype=np.float64)
+
+        def scaled(multiple: Optional[float]) -> np.ndarray:
+            if multiple is None:
+                return np.full(metrics.shape, np.nan)
+            return metrics * multiple
+
+        def bound(multiple: Optional[float]) -> np.ndarray:
+            # As in implied_value, a zero p25/p75 gives no bound while a
+            # zero reference multiple still gives an implied value
+            if ref_multiple is None or not multiple:
+                return scaled(None)
+            return scaled(multiple)
+
+        return {
+            "implied_value": scaled(ref_multiple),
+            "low": bound(stats["p25"]),
+            "high": bound(stats["p75"]),
+            "multiple_used": ref_multiple,
+            "transaction_count": stats["count"]
+        }
+
     def summary(self) -> dict:
         """
         Generate summary of precedent transaction analysis.
@@ -255,10 +430,15 @@ class PrecedentAnalysis:
         Returns:
             Dictionary with all multiple statistics and control premiums
         """
+        # Statistics for the three multiples and premiums in one batched sort
+        stats = _statistics_rows(np.vstack((
+            self._ev_ebitda, self._ev_ebit, self._ev_revenue,
+            self._control_premium
+        )))
         return {
-            "ev_ebitda": self.ev_ebitda_multiples(),
-            "ev_ebit": self.ev_ebit_multiples(),
-            "ev_revenue": self.ev_revenue_multiples(),
-            "control_premium": self.control_premium_statistics(),
+            "ev_ebitda": self._multiples(self._ev_ebitda, stats[0]),
+            "ev_ebit": self._multiples(self._ev_ebit, stats[1]),
+            "ev_revenue": self._multiples(self._ev_revenue, stats[2]),
+            "control_premium": stats[3],
             "transaction_count": len(self.transactions)
         }
@@ -9,8 +9,10 @@ This module implements:
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class SensitivityTable:
     """
     Two-dimensional sensitivity analysis table.
@@ -39,17 +41,25 @@ class SensitivityTable:
             return self.results[self.base_row_idx][self.base_col_idx]
         return None
 
+    def _valid_results(self) -> np.ndarray:
+        """All table cells as a flat array, without NaN (failed) cells."""
+        values = np.asarray(self.results, dtype=np.float64).ravel()
+        return values[~np.isnan(values)]
+
     def min_value(self) -> float:
-        """Get minimum value in table."""
-        return min(min(row) for row in self.results)
+        """Get minimum value in table, ignoring NaN cells."""
+        return self.range()[0]
 
     def max_value(self) -> float:
-        """Get maximum value in table."""
-        return max(max(row) for row in self.results)
+        """Get maximum value in table, ignoring NaN cells."""
+        return self.range()[1]
 
     def range(self) -> tuple[float, float]:
-        """Get value range (min, max)."""
-        return self.min_value(), self.max_value()
+        """Get value range (min, max), or (nan, nan) if no cell is valid."""
+        values = self._valid_results()
+        if values.size == 0:
+            return float('nan'), float('nan')
+        return float(values.min()), float(values.max())
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -64,7 +74,7 @@ class SensitivityTable:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FootballFieldBar:
     """
     Single bar in a football field chart.
@@ -86,7 +96,7 @@ class FootballFieldBar:
         return self.high - self.low
 
 
-@dataclass
+@dataclass(slots=True)
 class FootballField:
     """
     Football Field valuation summary.
@@ -157,7 +167,8 @@ class SensitivityAnalysis:
         row_values: list[float],
         col_values: list[float],
         base_row_value: Optional[float] = None,
-        base_col_value: Optional[float] = None
+        base_col_value: Optional[float] = None,
+        vectorized: bool = False
     ) -> SensitivityTable:
         """
         Create a two-variable sensitivity table.
@@ -170,20 +181,41 @@ class SensitivityAnalysis:
             col_values: List of column variable values to test
             base_row_value: Base case row value (for highlighting)
             base_col_value: Base case column value
+            vectorized: Call calc_func once with row and column grids
+                covering every cell (for NumPy-aware functions); falls
+                back to the per-cell loop if that call raises or returns
+                the wrong shape
 
         Returns:
             SensitivityTable with results
         """
-        results = []
-        for row_val in row_values:
-            row_results = []
-            for col_val in col_values:
-                try:
-                    result = calc_func(row_val, col_val)
-                except Exception:
-                    result = float('nan')
-                row_results.append(result)
-            results.append(row_results)
+        results = None
+        if vectorized:
+            row_grid, col_grid = np.meshgrid(
+                np.asarray(row_values, dtype=np.float64),
+                np.asarray(col_values, dtype=np.float64),
+                indexing="ij"
+            )
+            try:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    grid = np.asarray(calc_func(row_grid, col_grid),
+                                      dtype=np.float64)
+                if grid.shape == row_grid.shape:
+                    results = grid.tolist()
+            except Exception:
+                pass
+
+        if results is None:
+            results = []
+            for row_val in row_values:
+                row_results = []
+                for col_val in col_values:
+                    try:
+                        result = calc_func(row_val, col_val)
+                    except Exception:
+                        result = float('nan')
+                    row_results.append(result)
+                results.append(row_results)
 
         # Find base case indices
         base_row_idx = None
@@ -231,15 +263,14 @@ class SensitivityAnalysis:
         base_wacc = base_dcf.wacc
         base_growth = base_dcf.terminal_growth
 
-        def calc_ev(wacc: float, growth: float) -> float:
-            base_dcf.wacc = wacc
-            base_dcf.terminal_growth = growth
-            try:
-                result = base_dcf.value_perpetuity_method()
-                return result.enterprise_value
-            finally:
-                base_dcf.wacc = base_wacc
-                base_dcf.terminal_growth = base_growth
+        def calc_ev(wacc, growth):
+            if np.ndim(wacc):
+                # Whole (wacc, growth) meshgrid at once: one broadcast
+                return base_dcf.sensitivity_grid(wacc[:, 0], growth[0])
+            # Per-call overrides leave base_dcf untouched
+            return base_dcf.enterprise_value_perpetuity(
+                wacc=wacc, terminal_growth=growth
+            )
 
         return SensitivityAnalysis.create_table(
             calc_func=calc_ev,
@@ -248,7 +279,9 @@ class SensitivityAnalysis:
             row_values=wacc_range,
             col_values=growth_range,
             base_row_value=base_wacc,
-            base_col_value=base_growth
+            base_col_value=base_growth,
+            # The broadcast grid sums in floating point only
+            vectorized=base_dcf.precision == "fast"
         )
 
     @staticmethod
@@ -273,15 +306,13 @@ class SensitivityAnalysis:
         base_entry = base_lbo.entry_multiple
         base_exit = base_lbo.exit_multiple
 
-        def calc_irr(entry: float, exit_mult: float) -> float:
-            base_lbo.entry_multiple = entry
-            base_lbo.exit_multiple = exit_mult
-            try:
-                result = base_lbo.run_model()
-                return result.irr
-            finally:
-                base_lbo.entry_multiple = base_entry
-                base_lbo.exit_multiple = base_exit
+        def calc_irr(entry, exit_mult):
+            if np.ndim(entry):
+                # Whole (entry, exit) meshgrid from one debt schedule run
+                return base_lbo.irr_grid(entry[:, 0], exit_mult[0])
+            # Per-call overrides leave base_lbo untouched
+            return base_lbo.run_model(entry_multiple=entry,
+                                      exit_multiple=exit_mult).irr
 
         return SensitivityAnalysis.create_table(
             calc_func=calc_irr,
@@ -290,7 +321,8 @@ class SensitivityAnalysis:
             row_values=entry_multiples,
             col_values=exit_multiples,
             base_row_value=base_entry,
-            base_col_value=base_exit
+            base_col_value=base_exit,
+            vectorized=True
         )
 
     @staticmethod
@@ -10,10 +10,12 @@ SOTP is used for conglomerates where different business units
 have vastly different risk profiles and peer groups.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
 
+import numpy as np
+
 
 class ValuationMethod(Enum):
     """Valuation methodology for segment."""
@@ -26,7 +28,11 @@ class ValuationMethod(Enum):
     DDM = "ddm"
 
 
-@dataclass
+# Value string -> member, avoiding the Enum constructor per segment
+_METHODS = {m.value: m for m in ValuationMethod}
+
+
+@dataclass(slots=True)
 class Segment:
     """
     Business segment for SOTP analysis.
@@ -38,6 +44,9 @@ class Segment:
         multiple: Multiple to apply
         segment_value: Pre-calculated value (if using DCF/DDM)
         description: Optional description
+
+    The segment value is computed once at construction, so inputs should
+    not be modified afterwards.
     """
     name: str
     method: ValuationMethod
@@ -45,21 +54,27 @@ class Segment:
     multiple: float = 0.0
     segment_value: Optional[float] = None
     description: str = ""
+    _value: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Resolve the segment value once."""
+        if self.segment_value is not None:
+            self._value = self.segment_value
+        else:
+            self._value = self.metric_value * self.multiple
 
     @property
     def calculated_value(self) -> float:
         """
-        Calculate segment value.
+        Segment value.
 
         If segment_value is provided (e.g., from DCF), use it.
         Otherwise, calculate as metric × multiple.
         """
-        if self.segment_value is not None:
-            return self.segment_value
-        return self.metric_value * self.multiple
+        return self._value
 
 
-@dataclass
+@dataclass(slots=True)
 class SOTPResult:
     """Result of SOTP analysis."""
     segment_values: dict[str, float]
@@ -73,7 +88,7 @@ class SOTPResult:
     equity_value_per_share: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class SOTPModel:
     """
     Sum-of-the-Parts Valuation Model.
@@ -94,6 +109,9 @@ class SOTPModel:
         conglomerate_discount: Discount for conglomerate structure (0.10 = 10%)
         net_debt: Net debt for equity bridge
         shares_outstanding: Diluted shares for per-share value
+
+    Segment values are read into an array once at construction, so the
+    segments list should not be modified afterwards.
     """
     segments: list[Segment]
     corporate_overhead: float = 0.0
@@ -101,6 +119,16 @@ class SOTPModel:
     conglomerate_discount: float = 0.15  # 15% typical discount
     net_debt: float = 0.0
     shares_outstanding: Optional[float] = None
+    _segment_names: list[str] = field(init=False, repr=False, compare=False)
+    _segment_values: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Cache segment values as an array (segments are read once here)."""
+        self._segment_names = [s.name for s in self.segments]
+        self._segment_values = np.fromiter(
+            (s.calculated_value for s in self.segments),
+            dtype=np.float64, count=len(self.segments)
+        )
 
     @property
     def corporate_overhead_value(self) -> float:
@@ -112,6 +140,12 @@ class SOTPModel:
         """
         return self.corporate_overhead * self.overhead_multiple
 
+    def _ev_pre_discount(self) -> tuple[float, float, float]:
+        """Gross EV, overhead value and EV before the conglomerate discount."""
+        gross_ev = float(self._segment_values.sum())
+        overhead_value = self.corporate_overhead_value
+        return gross_ev, overhead_value, gross_ev - overhead_value
+
     def calculate(self) -> SOTPResult:
         """
         Perform SOTP valuation.
@@ -120,14 +154,11 @@ class SOTPModel:
             SOTPResult with detailed breakdown
         """
         # Calculate each segment's value
-        segment_values = {s.name: s.calculated_value for s in self.segments}
+        segment_values = dict(zip(self._segment_names,
+                                  self._segment_values.tolist()))
 
-        # Gross EV is sum of segments
-        gross_ev = sum(segment_values.values())
-
-        # Subtract corporate overhead
-        overhead_value = self.corporate_overhead_value
-        ev_pre_discount = gross_ev - overhead_value
+        # Gross EV is sum of segments, less capitalized corporate overhead
+        gross_ev, overhead_value, ev_pre_discount = self._ev_pre_discount()
 
         # Apply conglomerate discount
         discount_amount = ev_pre_discount * self.conglomerate_discount
@@ -162,16 +193,12 @@ class SOTPModel:
         Returns:
             Dictionary mapping discount rate to equity value
         """
-        original_discount = self.conglomerate_discount
-        results = {}
-
-        for discount in discounts:
-            self.conglomerate_discount = discount
-            result = self.calculate()
-            results[discount] = result.equity_value
+        # Only the discount varies, so the pre-discount EV is computed once
+        ev_pre_discount = self._ev_pre_discount()[2]
 
-        self.conglomerate_discount = original_discount
-        return results
+        discount_arr = np.asarray(discounts, dtype=np.float64)
+        equity = (ev_pre_discount - ev_pre_discount * discount_arr) - self.net_debt
+        return dict(zip(discounts, equity.tolist()))
 
     def segment_contribution(self) -> dict[str, float]:
         """
@@ -180,16 +207,14 @@ class SOTPModel:
         Returns:
             Dictionary mapping segment name to percentage contribution
         """
-        result = self.calculate()
-        total = result.gross_enterprise_value
+        values = self._segment_values
+        total = values.sum()
 
         if total == 0:
-            return {s.name: 0.0 for s in self.segments}
-
-        return {
-            name: value / total
-            for name, value in result.segment_values.items()
-        }
+            contribution = np.zeros_like(values)
+        else:
+            contribution = values / total
+        return dict(zip(self._segment_names, contribution.tolist()))
 
     @classmethod
     def from_dict(cls, segment_data: list[dict],
@@ -221,7 +246,8 @@ class SOTPModel:
         """
         segments = []
         for data in segment_data:
-            method = ValuationMethod(data.get("method", "ev_ebitda"))
+            raw_method = data.get("method", "ev_ebitda")
+            method = _METHODS.get(raw_method) or ValuationMethod(raw_method)
             segments.append(Segment(
                 name=data["name"],
                 method=method,
@@ -13,7 +13,7 @@ from typing import Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionGrant:
     """
     Option or warrant grant for TSM calculation.
@@ -69,6 +69,37 @@ def treasury_stock_method(
     return total_dilution
 
 
+def treasury_stock_method_arrays(
+    quantities,
+    strike_prices,
+    current_price: float
+) -> float:
+    """
+    Treasury Stock Method over parallel arrays of grants.
+
+    Same result as treasury_stock_method for large cap tables (e.g. in
+    Monte Carlo runs) without building an OptionGrant per grant; the
+    per-grant dilution is computed in one vectorized pass.
+
+    Args:
+        quantities: Number of options/warrants per grant
+        strike_prices: Exercise price per grant
+        current_price: Current stock price
+
+    Returns:
+        Number of additional dilutive shares
+    """
+    if current_price <= 0:
+        return 0.0
+
+    quantities = np.asarray(quantities, dtype=np.float64)
+    strike_prices = np.asarray(strike_prices, dtype=np.float64)
+    net_shares = quantities - quantities * strike_prices / current_price
+    # Zero out-of-the-money grants and clamp at zero without a gather
+    net_shares = np.where(strike_prices < current_price, net_shares, 0.0)
+    return float(np.maximum(net_shares, 0.0, out=net_shares).sum())
+
+
 def diluted_shares(
     basic_shares: float,
     options: list[OptionGrant],
@@ -105,6 +136,9 @@ def enterprise_value(
 
     EV = Equity Value + Debt - Cash + Minority Interest + Preferred
 
+    Arguments may be NumPy arrays (e.g. Monte Carlo draws); the result
+    is then computed element-wise as an array.
+
     Args:
         equity_value: Market cap or equity value
         total_debt: Total debt (short + long term)
@@ -130,6 +164,8 @@ def equity_value_from_ev(
 
     Equity = EV - Debt + Cash - Minority Interest - Preferred
 
+    Arguments may be NumPy arrays; the result is then element-wise.
+
     Args:
         enterprise_value: Enterprise Value
         total_debt: Total debt
@@ -153,6 +189,7 @@ def net_debt(
     Net Debt = Total Debt - Cash
 
     Negative net debt means company has more cash than debt.
+    Arguments may be NumPy arrays; the result is then element-wise.
 
     Args:
         total_debt: Total debt
@@ -175,6 +212,7 @@ def ltm_calculation(
     LTM = Fiscal Year + Current YTD - Prior Year YTD
 
     This calendarizes metrics to the most recent 12-month period.
+    Arguments may be NumPy arrays; the result is then element-wise.
 
     Args:
         fiscal_year: Full fiscal year amount
@@ -226,6 +264,7 @@ def rule_of_40(
     Rule of 40 = Revenue Growth % + Profit Margin %
 
     Score >= 40% generally indicates healthy SaaS business.
+    Arguments may be NumPy arrays; the result is then element-wise.
 
     Args:
         revenue_growth: YoY revenue growth rate (e.g., 0.25 for 25%)
@@ -245,7 +284,9 @@ def ev_to_equity_bridge(
     """
     Bridge from Enterprise Value to Equity Value per Share.
 
-    Common final step in DCF and Comps analysis.
+    Common final step in DCF and Comps analysis. enterprise_value and
+    net_debt may be NumPy arrays (e.g. a sensitivity sweep) with a scalar
+    share count; the values are then element-wise arrays.
 
     Args:
         enterprise_value: Enterprise Value
@@ -267,6 +308,31 @@ def ev_to_equity_bridge(
     }
 
 
+_YEAR_INDEX_CACHE: dict[int, np.ndarray] = {}
+
+
+def _year_index(n: int) -> np.ndarray:
+    """
+    Projection years 1..n as a shared, read-only float64 array.
+
+    Models discount the same short year sequence on every call; caching
+    it by length avoids re-allocating it in sensitivity and scenario loops.
+    """
+    years = _YEAR_INDEX_CACHE.get(n)
+    if years is None:
+        years = np.arange(1, n + 1, dtype=np.float64)
+        years.flags.writeable = False
+        _YEAR_INDEX_CACHE[n] = years
+    return years
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray,
+           mask: np.ndarray) -> np.ndarray:
+    """Element-wise numerator / denominator where mask holds, else NaN."""
+    out = np.full(numerator.shape, np.nan)
+    return np.divide(numerator, denominator, out=out, where=mask)
+
+
 def filter_valid_values(values: list[Optional[float]]) -> list[float]:
     """
     Filter out None values and return valid floats.
@@ -280,17 +346,31 @@ def filter_valid_values(values: list[Optional[float]]) -> list[float]:
     return [v for v in values if v is not None]
 
 
-def calculate_statistics(values: list[float]) -> dict:
+# Below this many values, statistics are computed in pure Python
+_SMALL_SAMPLE = 32
+
+
+def calculate_statistics(values) -> dict:
     """
     Calculate descriptive statistics for a list of values.
 
     Args:
-        values: List of numeric values
+        values: List or array of numeric values; NaN entries are ignored
 
     Returns:
         Dictionary with mean, median, min, max, p25, p75, and count
     """
-    if not values:
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size < _SMALL_SAMPLE:
+        # NumPy's per-call overhead outweighs the work for a few peers
+        ordered = sorted(v for v in arr.tolist() if v == v)
+        mean = sum(ordered) / len(ordered) if ordered else None
+    else:
+        arr = arr[~np.isnan(arr)]
+        ordered = np.sort(arr).tolist()
+        mean = float(arr.mean()) if arr.size else None
+
+    if not ordered:
         return {
             "mean": None,
             "median": None,
@@ -301,13 +381,77 @@ def calculate_statistics(values: list[float]) -> dict:
             "count": 0
         }
 
-    arr = np.array(values)
+    # Sorted once; every statistic is an index lookup with
+    # np.quantile's linear interpolation
+    last = len(ordered) - 1
+
+    def quantile(q: float) -> float:
+        position = last * q
+        below = int(position)
+        t = position - below
+        a, b = ordered[below], ordered[min(below + 1, last)]
+        diff = b - a
+        return b - diff * (1 - t) if t >= 0.5 else a + diff * t
+
     return {
-        "mean": float(np.mean(arr)),
-        "median": float(np.median(arr)),
-        "min": float(np.min(arr)),
-        "max": float(np.max(arr)),
-        "p25": float(np.percentile(arr, 25)),
-        "p75": float(np.percentile(arr, 75)),
-        "count": len(values)
+        "mean": mean,
+        "median": quantile(0.5),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p25": quantile(0.25),
+        "p75": quantile(0.75),
+        "count": len(ordered)
     }
+
+
+def _statistics_rows(matrix: np.ndarray) -> list[dict]:
+    """
+    calculate_statistics() for every row of a 2-D array in one batch.
+
+    Each row is sorted once (NaN sorts last), so min, max and the
+    quartiles are index lookups into that row's valid prefix, using the
+    same linear interpolation as np.quantile.
+
+    Args:
+        matrix: Array of shape (rows, values); NaN entries are ignored
+
+    Returns:
+        One statistics dictionary per row
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if matrix.shape[1] == 0:
+        return [calculate_statistics([]) for _ in range(matrix.shape[0])]
+    valid = ~np.isnan(matrix)
+    counts = valid.sum(axis=1)
+    ordered = np.sort(matrix, axis=1)
+    means = np.where(valid, matrix, 0.0).sum(axis=1) / np.maximum(counts, 1)
+
+    rows = np.arange(matrix.shape[0])
+    last = np.maximum(counts - 1, 0)
+
+    def quantile(q: float) -> list[float]:
+        position = last * q
+        below = np.floor(position).astype(np.intp)
+        t = position - below
+        a = ordered[rows, below]
+        b = ordered[rows, np.minimum(below + 1, last)]
+        diff = b - a
+        # np.quantile's lerp: interpolate from the nearer endpoint
+        return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t).tolist()
+
+    lo, p25, median, p75, hi = (quantile(q) for q in (0.0, 0.25, 0.5, 0.75, 1.0))
+    stats = []
+    for i, (count, mean) in enumerate(zip(counts.tolist(), means.tolist())):
+        if count == 0:
+            stats.append(calculate_statistics([]))
+            continue
+        stats.append({
+            "mean": mean,
+            "median": median[i],
+            "min": lo[i],
+            "max": hi[i],
+            "p25": p25[i],
+            "p75": p75[i],
+            "count": count
+        })
+    return stats
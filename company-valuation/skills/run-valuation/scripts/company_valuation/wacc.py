@@ -7,11 +7,14 @@ This module implements:
 - WACC calculation
 """
 
+import statistics
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class CostOfEquity:
     """
     Cost of Equity calculation using CAPM.
@@ -40,7 +43,6 @@ class CostOfEquity:
                   equity_risk_premium=erp)
 
 
-@dataclass
 class BetaCalculator:
     """
     Beta unlevering and relevering calculations.
@@ -112,29 +114,33 @@ class BetaCalculator:
 
         Returns:
             Relevered beta for target company
+
+        Raises:
+            ValueError: If the peer lists differ in length or are empty, or
+                a peer has zero equity
         """
         if len(peer_betas) != len(peer_debts) or len(peer_betas) != len(peer_equities):
             raise ValueError("All peer lists must have same length")
 
-        # Unlever each peer beta
+        if not peer_betas:
+            raise ValueError("At least one peer is required")
+
+        # Peer groups are small, so a plain loop beats NumPy's per-call
+        # overhead; unlever() inlined, with the tax shield factor hoisted
+        after_tax = 1 - tax_rate
         unlevered_betas = []
         for beta, debt, equity in zip(peer_betas, peer_debts, peer_equities):
-            unlevered = cls.unlever(beta, debt, equity, tax_rate)
-            unlevered_betas.append(unlevered)
-
-        # Take median unlevered beta
-        sorted_betas = sorted(unlevered_betas)
-        n = len(sorted_betas)
-        if n % 2 == 0:
-            median_unlevered = (sorted_betas[n//2 - 1] + sorted_betas[n//2]) / 2
-        else:
-            median_unlevered = sorted_betas[n//2]
+            if equity == 0:
+                raise ValueError("Equity cannot be zero")
+            unlevered_betas.append(beta / (1 + after_tax * (debt / equity)))
+
+        median_unlevered = statistics.median(unlevered_betas)
 
         # Relever at target structure
         return cls.relever(median_unlevered, target_debt, target_equity, tax_rate)
 
 
-@dataclass
+@dataclass(slots=True)
 class WACC:
     """
     Weighted Average Cost of Capital calculation.
@@ -162,12 +168,14 @@ class WACC:
     @property
     def equity_weight(self) -> float:
         """Weight of equity in capital structure."""
-        return self.equity_value / self.total_value if self.total_value > 0 else 0
+        total = self.total_value
+        return self.equity_value / total if total > 0 else 0
 
     @property
     def debt_weight(self) -> float:
         """Weight of debt in capital structure."""
-        return self.debt_value / self.total_value if self.total_value > 0 else 0
+        total = self.total_value
+        return self.debt_value / total if total > 0 else 0
 
     @property
     def after_tax_cost_of_debt(self) -> float:
@@ -181,10 +189,49 @@ class WACC:
         Returns:
             Weighted average cost of capital
         """
-        equity_component = self.equity_weight * self.cost_of_equity
-        debt_component = self.debt_weight * self.after_tax_cost_of_debt
+        # Total value once, rather than once per weight property
+        total = self.equity_value + self.debt_value
+        if total > 0:
+            equity_weight = self.equity_value / total
+            debt_weight = self.debt_value / total
+        else:
+            equity_weight = debt_weight = 0
+        equity_component = equity_weight * self.cost_of_equity
+        debt_component = debt_weight * (self.cost_of_debt * (1 - self.tax_rate))
         return equity_component + debt_component
 
+    @staticmethod
+    def calculate_batch(equity_value, debt_value, cost_of_equity,
+                        cost_of_debt, tax_rate) -> np.ndarray:
+        """
+        Calculate WACC over arrays of inputs without building instances.
+
+        For sensitivity grids and Monte Carlo draws. Inputs broadcast
+        against each other like NumPy arrays, and each point matches
+        WACC(...).calculate() for the same inputs.
+
+        Args:
+            equity_value: Market value(s) of equity
+            debt_value: Market value(s) of debt
+            cost_of_equity: Required return(s) on equity
+            cost_of_debt: Marginal cost(s) of debt
+            tax_rate: Marginal tax rate(s)
+
+        Returns:
+            Array of weighted average costs of capital
+        """
+        equity = np.asarray(equity_value, dtype=np.float64)
+        debt = np.asarray(debt_value, dtype=np.float64)
+        total = equity + debt
+        positive = total > 0
+        safe_total = np.where(positive, total, 1.0)
+        equity_weight = np.where(positive, equity / safe_total, 0.0)
+        debt_weight = np.where(positive, debt / safe_total, 0.0)
+        after_tax_cost_of_debt = (np.asarray(cost_of_debt, dtype=np.float64)
+                                  * (1 - np.asarray(tax_rate, dtype=np.float64)))
+        return (equity_weight * cost_of_equity
+                + debt_weight * after_tax_cost_of_debt)
+
     @classmethod
     def from_capm(cls, equity_value: float, debt_value: float,
                   risk_free_rate: float, beta: float, equity_risk_premium: float,
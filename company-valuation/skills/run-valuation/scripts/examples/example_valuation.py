@@ -34,17 +34,19 @@ def main():
         beta=1.15,                  # Company beta
         equity_risk_premium=0.05   # 5% ERP
     )
-    print(f"Cost of Equity (CAPM): {cost_of_equity.calculate():.2%}")
+    ke = cost_of_equity.calculate()
+    print(f"Cost of Equity (CAPM): {ke:.2%}")
 
     # Calculate WACC
     wacc = WACC(
         equity_value=10000,  # $10B market cap
         debt_value=3000,     # $3B debt
-        cost_of_equity=cost_of_equity.calculate(),
+        cost_of_equity=ke,
         cost_of_debt=0.065,  # 6.5% cost of debt
         tax_rate=0.25
     )
-    print(f"WACC: {wacc.calculate():.2%}")
+    wacc_rate = wacc.calculate()
+    print(f"WACC: {wacc_rate:.2%}")
     print(f"Equity Weight: {wacc.equity_weight:.1%}")
     print(f"Debt Weight: {wacc.debt_weight:.1%}")
 
@@ -70,7 +72,7 @@ def main():
 
     dcf = DCFModel(
         projections=projections,
-        wacc=wacc.calculate(),
+        wacc=wacc_rate,
         terminal_growth=0.025,
         exit_multiple=10.0,
         net_debt=2500,
@@ -183,17 +185,12 @@ def main():
     print("WACC \\ Growth    2.0%      2.5%      3.0%")
     print("-" * 45)
 
-    for w in wacc_range:
-        row = f"{w:.0%}          "
-        for g in growth_range:
-            dcf.wacc = w
-            dcf.terminal_growth = g
-            try:
-                ev = dcf.value_perpetuity_method().enterprise_value
-                row += f"${ev/1000:,.1f}B   "
-            except ValueError:
-                row += "   N/A    "
-        print(row)
+    ev_grid = dcf.sensitivity_grid(wacc_range, growth_range)
+    # NaN cells (WACC <= growth) print as N/A
+    cells = [["   N/A    " if ev != ev else f"${ev:,.1f}B   " for ev in evs]
+             for evs in (ev_grid / 1000).tolist()]
+    print("\n".join(f"{w:.0%}          " + "".join(row)
+                    for w, row in zip(wacc_range, cells)))
 
     # ================================================================
     # STEP 6: FOOTBALL FIELD SUMMARY
@@ -201,13 +198,9 @@ def main():
     print("\n6. VALUATION SUMMARY (Football Field)")
     print("-" * 40)
 
-    # Reset DCF to base case
-    dcf.wacc = wacc.calculate()
-    dcf.terminal_growth = 0.025
-
-    dcf_low = dcf.value_perpetuity_method().equity_value_per_share * 0.85
     dcf_mid = dcf.value_perpetuity_method().equity_value_per_share
-    dcf_high = dcf.value_perpetuity_method().equity_value_per_share * 1.15
+    dcf_low = dcf_mid * 0.85
+    dcf_high = dcf_mid * 1.15
 
     comps_low = implied['low'] / 500 - 2500/500  # Approximate equity per share
     comps_mid = implied['implied_value'] / 500 - 2500/500
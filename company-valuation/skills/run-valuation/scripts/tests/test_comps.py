@@ -1,5 +1,6 @@
 """Tests for Comparable Company Analysis."""
 
+import numpy as np
 import pytest
 from company_valuation.comps import PeerCompany, ComparableAnalysis
 
@@ -81,6 +82,19 @@ class TestPeerCompany:
         # EV/EBITDA = 11,000 / 1,000 = 11.0x
         assert peer.ev_ebitda() == pytest.approx(11.0, rel=1e-6)
 
+    def test_edited_price_updates_multiples(self):
+        """Test market cap, EV and multiples follow edits to the inputs."""
+        peer = PeerCompany(ticker="TEST", name="Test Co", price=100.0,
+                           shares_outstanding=100, net_debt=1000,
+                           ltm_ebitda=1000)
+
+        peer.price = 120.0
+        peer.net_debt = 0
+
+        assert peer.market_cap == pytest.approx(12000, rel=1e-12)
+        assert peer.enterprise_value == pytest.approx(12000, rel=1e-12)
+        assert peer.ev_ebitda() == pytest.approx(12.0, rel=1e-12)
+
     def test_ev_revenue_multiple(self):
         """Test EV/Revenue multiple calculation."""
         peer = PeerCompany(
@@ -199,6 +213,31 @@ class TestComparableAnalysis:
         assert result["high"] is not None
         assert result["low"] < result["implied_value"] < result["high"]
 
+    def test_implied_value_all_types(self, sample_peers):
+        """Test implied value uses each multiple's median, repeatably."""
+        analysis = ComparableAnalysis(sample_peers)
+        methods = {
+            "ev_ebitda": analysis.ev_ebitda_multiples,
+            "ev_ebit": lambda use_ntm: analysis.ev_ebit_multiples(),
+            "ev_revenue": analysis.ev_revenue_multiples,
+            "pe": analysis.pe_ratios,
+        }
+
+        for multiple_type, method in methods.items():
+            for use_ntm in (False, True):
+                median = method(use_ntm)["statistics"]["median"]
+                expected = None if median is None else pytest.approx(
+                    100.0 * median, rel=1e-12
+                )
+                for _ in range(2):
+                    result = analysis.implied_value(
+                        100.0, multiple_type, use_ntm=use_ntm
+                    )
+                    assert result["implied_value"] == expected
+
+        with pytest.raises(ValueError):
+            analysis.implied_value(100.0, "price_to_book")
+
     def test_summary(self, sample_peers):
         """Test summary includes all multiple types."""
         analysis = ComparableAnalysis(sample_peers)
@@ -210,6 +249,25 @@ class TestComparableAnalysis:
         assert "pe" in summary
         assert "price_to_book" in summary
 
+    def test_summary_matches_individual_methods(self, sample_peers):
+        """Test batched summary statistics match each multiple method."""
+        analysis = ComparableAnalysis(sample_peers)
+
+        for use_ntm in (False, True):
+            summary = analysis.summary(use_ntm)
+            expected = {
+                "ev_ebitda": analysis.ev_ebitda_multiples(use_ntm),
+                "ev_ebit": analysis.ev_ebit_multiples(),
+                "ev_revenue": analysis.ev_revenue_multiples(use_ntm),
+                "pe": analysis.pe_ratios(use_ntm),
+                "price_to_book": analysis.price_to_book_ratios(),
+            }
+            for name, data in expected.items():
+                assert summary[name]["multiples"] == data["multiples"]
+                assert summary[name]["statistics"] == pytest.approx(
+                    data["statistics"], rel=1e-12
+                )
+
     def test_empty_peer_group(self):
         """Test handling of empty peer group."""
         analysis = ComparableAnalysis([])
@@ -217,6 +275,7 @@ class TestComparableAnalysis:
 
         assert len(result["multiples"]) == 0
         assert result["statistics"]["mean"] is None
+        assert analysis.summary()["pe"]["statistics"]["median"] is None
 
     def test_pe_ratios(self, sample_peers):
         """Test P/E ratio calculation across peers."""
@@ -228,3 +287,69 @@ class TestComparableAnalysis:
 
         # Company A: EPS = 200/100 = 2.0; P/E = 100/2.0 = 50x
         assert result["multiples"]["A"] == pytest.approx(50.0, rel=1e-6)
+
+    def test_multiples_match_peer_methods(self):
+        """Test vectorized multiples match per-peer calculations."""
+        peers = [
+            PeerCompany(ticker="A", name="A", price=100, shares_outstanding=100,
+                       net_debt=500, ltm_ebitda=500, ntm_ebitda=600,
+                       ltm_net_income=200, ntm_eps=2.5, book_value=4000),
+            PeerCompany(ticker="B", name="B", price=80, shares_outstanding=150,
+                       net_debt=800, fy_ebitda=580, ytd_ebitda=300,
+                       prior_ytd_ebitda=280, ntm_ebitda=0, ltm_revenue=2500),
+            PeerCompany(ticker="C", name="C", price=50, shares_outstanding=10,
+                       net_debt=0, ltm_ebitda=-20, ltm_net_income=-5),
+        ]
+        analysis = ComparableAnalysis(peers)
+
+        for use_ntm in (False, True):
+            assert analysis.ev_ebitda_multiples(use_ntm)["multiples"] == {
+                p.ticker: p.ev_ebitda(use_ntm) for p in peers
+            }
+            assert analysis.ev_revenue_multiples(use_ntm)["multiples"] == {
+                p.ticker: p.ev_revenue(use_ntm) for p in peers
+            }
+            assert analysis.pe_ratios(use_ntm)["multiples"] == {
+                p.ticker: p.pe_ratio(use_ntm) for p in peers
+            }
+        assert analysis.price_to_book_ratios()["multiples"] == {
+            p.ticker: p.price_to_book() for p in peers
+        }
+
+    def test_from_columns_matches_peers(self):
+        """Test building from columns matches building from PeerCompany."""
+        data = {
+            "ticker": ["A", "B", "C"],
+            "price": [100.0, 80.0, 50.0],
+            "shares_outstanding": [100.0, 150.0, 10.0],
+            "net_debt": [500.0, 800.0, 0.0],
+            "ltm_ebitda": [500.0, 600.0, -20.0],
+            "ntm_ebitda": [600.0, np.nan, None],
+            "ltm_net_income": [200.0, None, -5.0],
+            "book_value": [4000.0, np.nan, 300.0],
+        }
+        from_columns = ComparableAnalysis.from_columns(data)
+        from_peers = ComparableAnalysis(from_columns.peers)
+
+        assert from_columns.peers[1].ntm_ebitda is None
+        assert from_columns.peers[0].name == "A"
+        for use_ntm in (False, True):
+            assert from_columns.summary(use_ntm) == from_peers.summary(use_ntm)
+
+    def test_from_columns_structured_array(self):
+        """Test a NumPy structured array is accepted as column data."""
+        data = np.array(
+            [("A", 100.0, 100.0, 500.0, 500.0), ("B", 80.0, 150.0, 800.0, 600.0)],
+            dtype=[("ticker", "U8"), ("price", "f8"), ("shares_outstanding", "f8"),
+                   ("net_debt", "f8"), ("ltm_ebitda", "f8")]
+        )
+        analysis = ComparableAnalysis.from_columns(data)
+
+        assert analysis.ev_ebitda_multiples()["multiples"] == {
+            "A": pytest.approx(21.0), "B": pytest.approx(21.333333333)
+        }
+
+    def test_from_columns_missing_required(self):
+        """Test a missing required column raises ValueError."""
+        with pytest.raises(ValueError):
+            ComparableAnalysis.from_columns({"ticker": ["A"], "price": [1.0]})
@@ -1,7 +1,11 @@
 """Tests for DCF model."""
 
+import math
+
+import numpy as np
 import pytest
-from company_valuation.dcf import DCFModel, UFCFProjection
+from company_valuation.dcf import (DCFModel, UFCFProjection,
+                                   _shared_discount_periods)
 
 
 class TestUFCFProjection:
@@ -83,6 +87,16 @@ class TestUFCFProjection:
         )
         assert proj.ebitda == 300
 
+    def test_cached_fields_hidden(self):
+        """Test cached NOPAT/UFCF stay out of repr and equality."""
+        kwargs = dict(year=1, revenue=1000, ebit=200, tax_rate=0.25,
+                      depreciation_amortization=50, capex=60, delta_nwc=20)
+        proj = UFCFProjection(**kwargs)
+
+        assert "_ufcf" not in repr(proj)
+        assert proj == UFCFProjection(**kwargs)
+        assert not hasattr(proj, "__dict__")
+
 
 class TestDCFModel:
     """Tests for DCF Model."""
@@ -103,6 +117,19 @@ class TestDCFModel:
                           depreciation_amortization=70, capex=80, delta_nwc=10),
         ]
 
+    def test_pv_explicit_matches_projections(self, sample_projections):
+        """Test vectorized explicit PV against per-projection UFCF."""
+        model = DCFModel(
+            projections=sample_projections,
+            wacc=0.10,
+            mid_year_convention=False
+        )
+        pv_total, pv_list = model.calculate_pv_explicit()
+
+        expected = [p.ufcf / 1.10 ** p.year for p in sample_projections]
+        assert pv_list == pytest.approx(expected, rel=1e-9)
+        assert pv_total == pytest.approx(sum(expected), rel=1e-9)
+
     def test_terminal_value_perpetuity(self, sample_projections):
         """Test terminal value using perpetuity growth method."""
         model = DCFModel(
@@ -253,3 +280,185 @@ class TestDCFModel:
 
         # With stub, first year cash flow is closer, value should be higher
         assert result_stub.enterprise_value > result_full.enterprise_value
+
+    def test_terminal_period(self, sample_projections):
+        """Test terminal period is stub + n - 1, i.e. n with no stub."""
+        full = DCFModel(projections=sample_projections, wacc=0.10)
+        stub = DCFModel(projections=sample_projections, wacc=0.10,
+                        stub_fraction=0.5)
+
+        assert full._terminal_period() == 5
+        assert stub._terminal_period() == 4.5
+
+    def test_discount_periods_shared_across_models(self, sample_projections):
+        """Test discount periods are cached per (n, stub, mid-year) setting."""
+        first = DCFModel(projections=sample_projections, wacc=0.10,
+                         stub_fraction=0.5)
+        second = DCFModel(projections=sample_projections, wacc=0.12,
+                          stub_fraction=0.5)
+
+        assert first._periods() is second._periods()
+        assert not first._periods().flags.writeable
+        assert first._get_discount_periods() == [0.25, 1.0, 2.0, 3.0, 4.0]
+
+        first.mid_year_convention = False
+        first.stub_fraction = 1.0
+        assert first._get_discount_periods() == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    def test_enterprise_value_perpetuity(self, sample_projections):
+        """Test scalar EV fast path matches the full result."""
+        model = DCFModel(projections=sample_projections, wacc=0.10,
+                         terminal_growth=0.025)
+
+        assert model.enterprise_value_perpetuity() == \
+            model.value_perpetuity_method().enterprise_value
+
+        model.terminal_growth = 0.12
+        with pytest.raises(ValueError):
+            model.enterprise_value_perpetuity()
+
+    def test_perpetuity_overrides(self, sample_projections):
+        """Test per-call WACC/growth overrides match a rebuilt model."""
+        model = DCFModel(projections=sample_projections, wacc=0.10,
+                         terminal_growth=0.025)
+        other = DCFModel(projections=sample_projections, wacc=0.09,
+                         terminal_growth=0.03)
+
+        result = model.value_perpetuity_method(wacc=0.09, terminal_growth=0.03)
+
+        assert result.enterprise_value == \
+            other.value_perpetuity_method().enterprise_value
+        assert model.enterprise_value_perpetuity(wacc=0.09, terminal_growth=0.03) == \
+            result.enterprise_value
+        assert model.wacc == 0.10 and model.terminal_growth == 0.025
+        with pytest.raises(ValueError):
+            model.enterprise_value_perpetuity(wacc=0.02)
+
+    def test_exact_precision(self, sample_projections):
+        """Test the math.fsum path agrees with the default summation."""
+        fast = DCFModel(projections=sample_projections, wacc=0.10,
+                        exit_multiple=10.0)
+        exact = DCFModel(projections=sample_projections, wacc=0.10,
+                         exit_multiple=10.0, precision="exact")
+
+        for method in ("perpetuity", "exit_multiple"):
+            assert exact.value(method).enterprise_value == pytest.approx(
+                fast.value(method).enterprise_value, rel=1e-12
+            )
+        total, pv_list = exact.calculate_pv_explicit()
+        assert total == math.fsum(pv_list)
+
+    def test_unknown_precision_raises(self, sample_projections):
+        """Test an unsupported precision mode is rejected."""
+        with pytest.raises(ValueError):
+            DCFModel(projections=sample_projections, wacc=0.10,
+                     precision="kahan")
+
+    def test_wacc_at_or_below_minus_one_raises(self, sample_projections):
+        """Test a WACC of -100% or lower is rejected."""
+        with pytest.raises(ValueError):
+            DCFModel(projections=sample_projections, wacc=-1.0)
+
+    def test_empty_projections_raises(self):
+        """Test a model with no projection years is rejected."""
+        with pytest.raises(ValueError):
+            DCFModel(projections=[], wacc=0.10)
+
+    def test_discount_factor_matches_power(self, sample_projections):
+        """Test exp/log1p discount factors agree with (1 + WACC) ** -t."""
+        model = DCFModel(projections=sample_projections, wacc=0.10)
+        periods = np.array(model._get_discount_periods())
+
+        assert model._discount_factors() == pytest.approx(1.10 ** -periods,
+                                                          rel=1e-14)
+        assert model._discount_factor(5) == pytest.approx(1.10 ** -5,
+                                                          rel=1e-14)
+
+    def test_discount_factors_reused_until_inputs_change(self, sample_projections):
+        """Test cached discount factors follow WACC and stub changes."""
+        model = DCFModel(projections=sample_projections, wacc=0.10)
+        factors = model._discount_factors()
+
+        assert model._discount_factors() is factors
+        assert not factors.flags.writeable
+
+        model.wacc = 0.12
+        assert model._discount_factors()[0] == pytest.approx(1.12 ** -0.5)
+        model.stub_fraction = 0.5
+        assert model._discount_factors()[0] == pytest.approx(1.12 ** -0.25)
+
+    def test_discount_periods_cache_is_bounded(self, sample_projections):
+        """Test a sweep over stub fractions does not grow the cache forever."""
+        model = DCFModel(projections=sample_projections, wacc=0.10)
+
+        for i in range(300):
+            model.stub_fraction = 0.25 + i / 1000
+            model.enterprise_value_perpetuity()
+
+        assert _shared_discount_periods.cache_info().currsize <= 128
+
+    def test_sensitivity_grid_matches_single_valuations(self, sample_projections):
+        """Test broadcast grid matches per-cell perpetuity valuation."""
+        model = DCFModel(
+            projections=sample_projections,
+            wacc=0.10,
+            terminal_growth=0.025,
+            stub_fraction=0.5
+        )
+        wacc_range = [0.03, 0.09, 0.10]
+        growth_range = [0.02, 0.03]
+
+        grid = model.sensitivity_grid(wacc_range, growth_range)
+
+        assert grid.shape == (3, 2)
+        assert np.isnan(grid[0, 1])
+        for i, w in enumerate(wacc_range[1:], start=1):
+            for j, g in enumerate(growth_range):
+                cell = DCFModel(
+                    projections=sample_projections,
+                    wacc=w,
+                    terminal_growth=g,
+                    stub_fraction=0.5
+                ).value_perpetuity_method().enterprise_value
+                assert grid[i, j] == pytest.approx(cell, rel=1e-9)
+
+    def test_sensitivity_grid_float32(self, sample_projections):
+        """Test single-precision grid stays close to the float64 grid."""
+        model = DCFModel(projections=sample_projections, wacc=0.10)
+        wacc_range = [0.02, 0.08, 0.10, 0.12]
+        growth_range = [0.02, 0.025, 0.03]
+
+        grid64 = model.sensitivity_grid(wacc_range, growth_range)
+        grid32 = model.sensitivity_grid(wacc_range, growth_range,
+                                        dtype=np.float32)
+
+        assert grid32.dtype == np.float64
+        assert np.array_equal(np.isnan(grid32), np.isnan(grid64))
+        assert grid32 == pytest.approx(grid64, rel=1e-5, nan_ok=True)
+
+    def test_value_many_matches_single_valuations(self, sample_projections):
+        """Test scenario batch matches per-scenario perpetuity valuation."""
+        model = DCFModel(projections=sample_projections, wacc=0.10)
+        wacc = np.array([0.08, 0.10, 0.02])
+        growth = np.array([0.02, 0.03, 0.03])
+        stub = np.array([1.0, 0.5, 1.0])
+
+        evs = model.value_many(wacc, growth, stub)
+
+        assert np.isnan(evs[2])
+        for i in range(2):
+            single = DCFModel(
+                projections=sample_projections,
+                wacc=wacc[i],
+                terminal_growth=growth[i],
+                stub_fraction=stub[i]
+            ).value_perpetuity_method().enterprise_value
+            assert evs[i] == pytest.approx(single, rel=1e-9)
+
+    def test_sample_lhs_stratified(self):
+        """Test Latin hypercube samples hit every stratum once."""
+        wacc, growth = DCFModel.sample_lhs(10, (0.08, 0.12), (0.01, 0.03), seed=1)
+
+        strata = np.floor((wacc - 0.08) / 0.04 * 10).astype(int)
+        assert sorted(strata.tolist()) == list(range(10))
+        assert growth.min() >= 0.01 and growth.max() <= 0.03
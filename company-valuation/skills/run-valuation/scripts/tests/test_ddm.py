@@ -1,5 +1,6 @@
 """Tests for Dividend Discount Model."""
 
+import numpy as np
 import pytest
 from company_valuation.ddm import DDMModel, DividendProjection
 
@@ -67,6 +68,36 @@ class TestDDMModel:
         assert pv_total == pytest.approx(sum(pv_list), rel=1e-6)
         assert pv_total > 0
 
+    def test_pv_dividends_non_contiguous_years(self):
+        """Test discounting when projection years have gaps."""
+        model = DDMModel(
+            projections=[
+                DividendProjection(year=1, eps=5.0, payout_ratio=0.40),
+                DividendProjection(year=3, eps=6.0, payout_ratio=0.40),
+            ],
+            cost_of_equity=0.10,
+            terminal_growth=0.03
+        )
+        pv_total, pv_list = model.calculate_pv_dividends()
+
+        assert pv_list[1] == pytest.approx(2.4 / 1.10 ** 3, rel=1e-6)
+        assert model.value_gordon_growth().pv_explicit_dividends == \
+            pytest.approx(pv_total, rel=1e-6)
+
+    def test_pv_dividends_long_horizon(self):
+        """Test the vectorized path used for longer forecasts."""
+        dps = [1.0 + 0.1 * i for i in range(12)]
+        model = DDMModel.from_dividend_forecast(
+            dps_forecasts=dps,
+            cost_of_equity=0.10,
+            terminal_growth=0.03
+        )
+        pv_total, pv_list = model.calculate_pv_dividends()
+
+        expected = [d / 1.10 ** (i + 1) for i, d in enumerate(dps)]
+        assert pv_list == pytest.approx(expected, rel=1e-9)
+        assert pv_total == pytest.approx(sum(expected), rel=1e-9)
+
     def test_terminal_value_gordon_growth(self, sample_projections):
         """Test terminal value using Gordon Growth."""
         model = DDMModel(
@@ -103,6 +134,19 @@ class TestDDMModel:
         with pytest.raises(ValueError):
             model.terminal_value_gordon_growth()
 
+    def test_empty_projections_raises(self):
+        """Test a model with no projection years is rejected."""
+        with pytest.raises(ValueError):
+            DDMModel(projections=[], cost_of_equity=0.10)
+
+    def test_empty_forecast_raises(self):
+        """Test the forecast constructors reject an empty forecast."""
+        with pytest.raises(ValueError):
+            DDMModel.from_dividend_forecast([], cost_of_equity=0.10)
+        with pytest.raises(ValueError):
+            DDMModel.from_eps_forecast([], payout_ratio=0.4,
+                                       cost_of_equity=0.10)
+
     def test_full_valuation_gordon(self, sample_projections):
         """Test complete DDM valuation with Gordon Growth."""
         model = DDMModel(
@@ -193,3 +237,65 @@ class TestDDMModel:
         # Terminal value typically dominates
         tv_pct = result.pv_terminal_value / result.equity_value_per_share
         assert 0.50 < tv_pct < 0.90
+
+    def test_value_many_matches_single(self, sample_projections):
+        """Test batch valuation matches per-model valuation."""
+        dps = [p.dps for p in sample_projections]
+        years = [p.year for p in sample_projections]
+        ke = [0.09, 0.10, 0.12]
+        g = [0.02, 0.03, 0.03]
+
+        grid = DDMModel.value_many([dps, [d * 1.1 for d in dps]], years, ke, g)
+
+        assert grid.shape == (2, 3)
+        for k in range(3):
+            model = DDMModel(
+                projections=sample_projections,
+                cost_of_equity=ke[k],
+                terminal_growth=g[k]
+            )
+            assert grid[0, k] == pytest.approx(
+                model.value_gordon_growth().equity_value_per_share, rel=1e-9
+            )
+
+    def test_value_many_growth_exceeds_ke_raises(self):
+        """Test batch valuation rejects g >= ke."""
+        with pytest.raises(ValueError):
+            DDMModel.value_many([1.0, 1.1], [1, 2], [0.08], [0.08])
+
+    def test_simulate_matches_value_many(self):
+        """Test compiled scenario kernel matches the broadcast version."""
+        rng = np.random.default_rng(0)
+        dps = 2.0 * np.cumprod(1.0 + rng.normal(0.05, 0.02, (50, 5)), axis=1)
+        years = np.arange(1, 6)
+        ke = np.array([0.08, 0.10, 0.12])
+        g = np.array([0.02, 0.03, 0.04])
+
+        assert DDMModel.simulate(dps, years, ke, g) == pytest.approx(
+            DDMModel.value_many(dps, years, ke, g), rel=1e-9
+        )
+
+    def test_from_constant_growth_matches_explicit(self):
+        """Test closed-form growing annuity matches explicit discounting."""
+        for growth in (0.05, 0.10):  # 0.10 == ke exercises the limit case
+            dps = [2.0 * (1 + growth) ** t for t in range(6)]
+            explicit = DDMModel.from_dividend_forecast(
+                dps_forecasts=dps, cost_of_equity=0.10, terminal_growth=0.03
+            ).value_gordon_growth()
+            closed = DDMModel.from_constant_growth(
+                d1=2.0, growth=growth, years=6,
+                cost_of_equity=0.10, terminal_growth=0.03
+            ).value_gordon_growth()
+
+            assert closed.pv_explicit_dividends == pytest.approx(
+                explicit.pv_explicit_dividends, rel=1e-9
+            )
+            assert closed.equity_value_per_share == pytest.approx(
+                explicit.equity_value_per_share, rel=1e-9
+            )
+
+    def test_from_constant_growth_zero_years_raises(self):
+        """Test a constant-growth model needs at least one explicit year."""
+        with pytest.raises(ValueError, match="years"):
+            DDMModel.from_constant_growth(d1=2.0, growth=0.05, years=0,
+                                          cost_of_equity=0.10)
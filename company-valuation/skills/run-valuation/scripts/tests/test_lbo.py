@@ -1,5 +1,8 @@
 """Tests for LBO Model."""
 
+import warnings
+from dataclasses import replace
+
 import pytest
 from company_valuation.lbo import LBOModel, LBOProjection, DebtTranche, SourcesAndUses
 
@@ -69,24 +72,31 @@ class TestSourcesAndUses:
         assert not sau.is_balanced()
 
 
+@pytest.fixture(scope="module")
+def simple_lbo():
+    """Create simple LBO model for testing (shared; tests only read it)."""
+    return LBOModel.simple_lbo(
+        entry_ebitda=100,
+        entry_multiple=10.0,
+        leverage_turns=6.0,
+        interest_rate=0.08,
+        exit_multiple=10.0,
+        hold_years=5,
+        ebitda_growth=0.05,
+        capex_pct=0.15,
+        tax_rate=0.25
+    )
+
+
+@pytest.fixture(scope="module")
+def simple_lbo_result(simple_lbo):
+    """Run the shared LBO model once for all result tests."""
+    return simple_lbo.run_model()
+
+
 class TestLBOModel:
     """Tests for LBO Model."""
 
-    @pytest.fixture
-    def simple_lbo(self):
-        """Create simple LBO model for testing."""
-        return LBOModel.simple_lbo(
-            entry_ebitda=100,
-            entry_multiple=10.0,
-            leverage_turns=6.0,
-            interest_rate=0.08,
-            exit_multiple=10.0,
-            hold_years=5,
-            ebitda_growth=0.05,
-            capex_pct=0.15,
-            tax_rate=0.25
-        )
-
     def test_purchase_price(self, simple_lbo):
         """Test purchase price calculation."""
         # Entry EBITDA × Multiple = 100 × 10 = 1000
@@ -112,34 +122,51 @@ class TestLBOModel:
         assert sau.sponsor_equity > 0
         assert sau.is_balanced()
 
-    def test_run_model_returns_positive(self, simple_lbo):
+    def test_run_model_returns_positive(self, simple_lbo_result):
         """Test that model runs and returns positive returns."""
-        result = simple_lbo.run_model()
+        result = simple_lbo_result
 
         assert result.moic > 0
         assert result.irr > 0
         assert result.exit_equity > 0
         assert len(result.yearly_results) == 5
 
-    def test_debt_paydown_occurs(self, simple_lbo):
+    def test_debt_paydown_occurs(self, simple_lbo, simple_lbo_result):
         """Test that debt gets paid down over time."""
-        result = simple_lbo.run_model()
+        result = simple_lbo_result
 
         # Ending debt should be less than starting debt
         assert result.exit_net_debt < simple_lbo.total_initial_debt
         assert result.total_debt_paydown > 0
 
-    def test_irr_moic_relationship(self, simple_lbo):
+    def test_irr_moic_relationship(self, simple_lbo_result):
         """Test IRR and MOIC relationship: IRR = MOIC^(1/years) - 1."""
-        result = simple_lbo.run_model()
+        result = simple_lbo_result
 
         # Recalculate IRR from MOIC
         expected_irr = (result.moic ** (1/5)) - 1
         assert result.irr == pytest.approx(expected_irr, rel=1e-4)
 
-    def test_yearly_results_structure(self, simple_lbo):
+    def test_iteration_kwargs_ignored(self, simple_lbo, simple_lbo_result):
+        """Test interest is exact without fixed-point iteration."""
+        with pytest.warns(DeprecationWarning):
+            result = simple_lbo.run_model(max_iterations=1,
+                                          convergence_threshold=1e9)
+
+        assert result == simple_lbo_result
+
+    def test_default_iteration_kwargs_do_not_warn(self, simple_lbo):
+        """Test only non-default iteration kwargs are deprecated."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            simple_lbo.run_model(max_iterations=10, convergence_threshold=0.01)
+
+        with pytest.warns(DeprecationWarning):
+            simple_lbo.run_model(max_iterations=20)
+
+    def test_yearly_results_structure(self, simple_lbo_result):
         """Test yearly results contain expected fields."""
-        result = simple_lbo.run_model()
+        result = simple_lbo_result
 
         for yearly in result.yearly_results:
             assert "year" in yearly
@@ -148,9 +175,9 @@ class TestLBOModel:
             assert "fcf" in yearly
             assert "ending_debt" in yearly
 
-    def test_ebitda_growth(self, simple_lbo):
+    def test_ebitda_growth(self, simple_lbo_result):
         """Test EBITDA grows at specified rate."""
-        result = simple_lbo.run_model()
+        result = simple_lbo_result
 
         # Year 1 EBITDA = 100 × 1.05 = 105
         assert result.yearly_results[0]["ebitda"] == pytest.approx(105, rel=1e-2)
@@ -159,6 +186,35 @@ class TestLBOModel:
         expected_y5 = 100 * (1.05 ** 5)
         assert result.yearly_results[4]["ebitda"] == pytest.approx(expected_y5, rel=1e-2)
 
+    def test_solve_for_entry_multiple(self, simple_lbo):
+        """Test solved multiple hits target IRR without mutating the model."""
+        multiple = simple_lbo.solve_for_entry_multiple(target_irr=0.20)
+
+        assert 5.0 <= multiple <= 15.0
+        assert simple_lbo.entry_multiple == 10.0
+        result = replace(simple_lbo, entry_multiple=multiple).run_model()
+        assert result.irr == pytest.approx(0.20, rel=1e-9)
+
+    def test_solve_for_entry_multiple_out_of_range(self, simple_lbo):
+        """Test unreachable target IRR returns None."""
+        assert simple_lbo.solve_for_entry_multiple(target_irr=1.0,
+                                                   min_multiple=8.0) is None
+        assert simple_lbo.solve_for_entry_multiple(target_irr=-0.5) is None
+
+    def test_solve_for_entry_multiple_within_tolerance_of_bound(self, simple_lbo):
+        """Test a root just outside the range returns the bound within tolerance."""
+        exact = simple_lbo.solve_for_entry_multiple(target_irr=0.20)
+
+        assert simple_lbo.solve_for_entry_multiple(
+            target_irr=0.20, min_multiple=exact + 0.01
+        ) == exact + 0.01
+        assert simple_lbo.solve_for_entry_multiple(
+            target_irr=0.20, max_multiple=exact - 0.01
+        ) == exact - 0.01
+        assert simple_lbo.solve_for_entry_multiple(
+            target_irr=0.20, min_multiple=exact + 0.01, tolerance=1e-6
+        ) is None
+
     def test_higher_leverage_higher_irr(self):
         """Test that higher leverage increases IRR (with constant EBITDA)."""
         low_leverage = LBOModel.simple_lbo(
@@ -222,3 +278,59 @@ class TestLBOModel:
 
         assert result.moic > 0
         assert len(result.yearly_results) == 5
+
+    def test_sweep_priority_and_revolver_draw(self):
+        """Test sweep follows priority order and shortfalls draw the revolver."""
+        model = LBOModel(
+            entry_ebitda=100,
+            entry_multiple=10.0,
+            debt_tranches=[
+                DebtTranche(name="Junior", amount=100, interest_rate=0.10,
+                           cash_sweep_priority=2),
+                DebtTranche(name="Senior", amount=50, interest_rate=0.0,
+                           cash_sweep_priority=1),
+                DebtTranche(name="Revolver", amount=0, interest_rate=0.0,
+                           is_revolver=True, revolver_commitment=30)
+            ],
+            projections=[
+                LBOProjection(year=1, ebitda=100, tax_rate=0.0),
+                LBOProjection(year=2, ebitda=10, capex=50, tax_rate=0.0)
+            ],
+            exit_multiple=10.0
+        )
+
+        year1, year2 = model.run_model().yearly_results
+
+        # Year 1: FCF of 90 retires Senior (50) before Junior (40 of 100)
+        assert year1["cash_sweep"] == pytest.approx(90)
+        assert year1["ending_debt"] == pytest.approx(60)
+        # Year 2: only the 60 Junior balance accrues interest, and the
+        # shortfall of 46 draws the revolver up to its 30 commitment
+        assert year2["interest_expense"] == pytest.approx(6)
+        assert year2["revolver_change"] == pytest.approx(30)
+        assert year2["ending_debt"] == pytest.approx(90)
+
+    def test_multiple_revolvers_share_shortfall(self):
+        """Test a shortfall is drawn across revolvers only once in total."""
+        model = LBOModel(
+            entry_ebitda=100,
+            entry_multiple=10.0,
+            debt_tranches=[
+                DebtTranche(name="Term Loan", amount=100, interest_rate=0.0),
+                DebtTranche(name="Revolver B", amount=0, interest_rate=0.0,
+                           is_revolver=True, revolver_commitment=20,
+                           cash_sweep_priority=2),
+                DebtTranche(name="Revolver A", amount=0, interest_rate=0.0,
+                           is_revolver=True, revolver_commitment=20,
+                           cash_sweep_priority=1)
+            ],
+            projections=[LBOProjection(year=1, ebitda=10, capex=40,
+                                       tax_rate=0.0)],
+            exit_multiple=10.0
+        )
+
+        year1, = model.run_model().yearly_results
+
+        # Shortfall of 30: Revolver A draws 20, then Revolver B draws 10
+        assert year1["revolver_change"] == pytest.approx(30)
+        assert year1["ending_debt"] == pytest.approx(130)
@@ -75,6 +75,24 @@ class TestTransaction:
         assert txn.ev_revenue is None
         assert txn.control_premium is None
 
+    def test_edited_inputs_update_multiples(self):
+        """Test multiples follow edits to the deal inputs."""
+        txn = Transaction(
+            target_name="Target Co",
+            acquirer_name="Acquirer Inc",
+            announce_date=date(2024, 6, 15),
+            deal_value=1000,
+            equity_value=800,
+            target_ltm_ebitda=100,
+            pre_announcement_price=80.0,
+            deal_price_per_share=100.0
+        )
+        txn.target_ltm_ebitda = 125
+        txn.deal_price_per_share = 120.0
+
+        assert txn.ev_ebitda == pytest.approx(8.0, rel=1e-12)
+        assert txn.control_premium == pytest.approx(0.5, rel=1e-12)
+
 
 class TestPrecedentAnalysis:
     """Tests for PrecedentAnalysis."""
@@ -180,6 +198,73 @@ class TestPrecedentAnalysis:
         assert result["transaction_count"] == 4
         assert result["implied_value"] > 0
 
+    def test_implied_value_matches_multiples(self, sample_transactions):
+        """Test implied value uses the statistics of each multiple."""
+        analysis = PrecedentAnalysis(sample_transactions)
+
+        for multiple_type, data in (("ev_ebitda", analysis.ev_ebitda_multiples()),
+                                    ("ev_revenue", analysis.ev_revenue_multiples())):
+            result = analysis.implied_value(100.0, multiple_type, use_median=False)
+            assert result["implied_value"] == pytest.approx(
+                100.0 * data["statistics"]["mean"], rel=1e-12
+            )
+            assert result["transaction_count"] == data["statistics"]["count"]
+
+        with pytest.raises(ValueError):
+            analysis.implied_value(100.0, "pe")
+
+    def test_implied_value_reuses_statistics(self, sample_transactions):
+        """Test repeated implied values share one statistics computation."""
+        analysis = PrecedentAnalysis(sample_transactions)
+
+        first = analysis.implied_value(100.0)
+        stats = analysis._stats_cache["ev_ebitda"]
+        second = analysis.implied_value(200.0)
+
+        assert analysis._stats_cache["ev_ebitda"] is stats
+        assert second["implied_value"] == pytest.approx(
+            2 * first["implied_value"], rel=1e-12
+        )
+        assert analysis.filter_by_deal_type("financial")._stats_cache == {}
+
+    def test_implied_value_batch_matches_scalar(self, sample_transactions):
+        """Test batched implied values match per-metric implied_value."""
+        analysis = PrecedentAnalysis(sample_transactions)
+        metrics = [80.0, 120.0, 150.0]
+
+        batch = analysis.implied_value_batch(metrics, "ev_revenue",
+                                             use_median=False)
+
+        for i, metric in enumerate(metrics):
+            single = analysis.implied_value(metric, "ev_revenue",
+                                            use_median=False)
+            for key in ("implied_value", "low", "high"):
+                assert batch[key][i] == pytest.approx(single[key], rel=1e-12)
+        assert batch["transaction_count"] == 4
+
+        empty = analysis.filter_by_sector("Healthcare")
+        result = empty.implied_value_batch(metrics)
+        assert result["multiple_used"] is None
+        assert all(v != v for v in result["implied_value"])
+
+    def test_implied_value_batch_zero_multiple(self):
+        """Test a zero multiple is handled the same as implied_value."""
+        zero_value = Transaction(
+            target_name="Zero", acquirer_name="Buyer",
+            announce_date=date(2024, 2, 1), deal_value=0, equity_value=0,
+            target_ltm_ebitda=100
+        )
+        analysis = PrecedentAnalysis([zero_value])
+
+        single = analysis.implied_value(50.0)
+        batch = analysis.implied_value_batch([50.0])
+
+        assert single["implied_value"] == 0.0
+        assert batch["implied_value"][0] == 0.0
+        assert single["low"] is None and single["high"] is None
+        assert batch["low"][0] != batch["low"][0]
+        assert batch["high"][0] != batch["high"][0]
+
     def test_summary(self, sample_transactions):
         """Test summary includes all metrics."""
         analysis = PrecedentAnalysis(sample_transactions)
@@ -191,6 +276,25 @@ class TestPrecedentAnalysis:
         assert "control_premium" in summary
         assert summary["transaction_count"] == 4
 
+    def test_summary_matches_individual_methods(self, sample_transactions):
+        """Test batched summary statistics match each multiple method."""
+        analysis = PrecedentAnalysis(sample_transactions)
+        summary = analysis.summary()
+        expected = {
+            "ev_ebitda": analysis.ev_ebitda_multiples(),
+            "ev_ebit": analysis.ev_ebit_multiples(),
+            "ev_revenue": analysis.ev_revenue_multiples(),
+        }
+
+        for name, data in expected.items():
+            assert summary[name]["multiples"] == data["multiples"]
+            assert summary[name]["statistics"] == pytest.approx(
+                data["statistics"], rel=1e-12
+            )
+        assert summary["control_premium"] == pytest.approx(
+            analysis.control_premium_statistics(), rel=1e-12
+        )
+
     def test_empty_after_filter(self, sample_transactions):
         """Test handling when filter results in no transactions."""
         analysis = PrecedentAnalysis(sample_transactions)
@@ -213,3 +317,58 @@ class TestPrecedentAnalysis:
 
         # Should get strategic deals from last 3 years above 500
         assert len(result.transactions) == 2
+
+    def test_combined_filter_matches_chain(self, sample_transactions):
+        """Test single-pass filter matches chained filter_by_* calls."""
+        analysis = PrecedentAnalysis(sample_transactions)
+
+        result = analysis.filter(
+            max_years=3.0, reference_date=date(2025, 1, 1),
+            deal_type="strategic", min_value=500
+        )
+
+        assert [t.target_name for t in result.transactions] == [
+            "Target A", "Target C"
+        ]
+
+    def test_filter_by_recency_non_finite(self, sample_transactions):
+        """Test infinite max_years keeps every deal and NaN keeps none."""
+        analysis = PrecedentAnalysis(sample_transactions)
+        ref = date(2025, 1, 1)
+
+        assert len(analysis.filter_by_recency(float('inf'), ref).transactions) == 4
+        assert len(analysis.filter_by_recency(float('nan'), ref).transactions) == 0
+
+    def test_filter_by_missing_sector(self, sample_transactions):
+        """Test filtering on None matches deals without a sector or type."""
+        no_sector = Transaction(
+            target_name="Unknown", acquirer_name="Buyer",
+            announce_date=date(2024, 2, 1), deal_value=700, equity_value=500,
+            deal_type=None
+        )
+        analysis = PrecedentAnalysis(sample_transactions + [no_sector])
+
+        assert [t.target_name for t in
+                analysis.filter_by_sector(None).transactions] == ["Unknown"]
+        assert [t.target_name for t in
+                analysis.filter_by_deal_type(None).transactions] == ["Unknown"]
+
+    def test_years_since_array(self, sample_transactions):
+        """Test vectorized recency matches per-transaction years_since."""
+        analysis = PrecedentAnalysis(sample_transactions)
+        ref = date(2025, 1, 1)
+
+        years = analysis.years_since_array(ref)
+
+        assert years.tolist() == pytest.approx(
+            [t.years_since(ref) for t in sample_transactions], rel=1e-12
+        )
+
+    def test_filtered_columns_match_fresh_analysis(self, sample_transactions):
+        """Test a filtered analysis matches one built from the same deals."""
+        filtered = PrecedentAnalysis(sample_transactions).filter(
+            max_years=3.0, reference_date=date(2025, 1, 1)
+        )
+        fresh = PrecedentAnalysis(list(filtered.transactions))
+
+        assert filtered.summary() == fresh.summary()
@@ -1,6 +1,8 @@
 """Tests for Sensitivity Analysis."""
 
 import pytest
+from company_valuation.dcf import DCFModel, UFCFProjection
+from company_valuation.lbo import LBOModel
 from company_valuation.sensitivity import (
     SensitivityAnalysis, SensitivityTable, FootballField, FootballFieldBar
 )
@@ -30,6 +32,21 @@ class TestSensitivityTable:
         assert table.max_value() == 150
         assert table.range() == (80, 150)
 
+    def test_range_ignores_nan(self):
+        """Test min/max skip failed (NaN) cells wherever they appear."""
+        nan = float('nan')
+        table = SensitivityTable(
+            row_variable="WACC",
+            col_variable="Growth",
+            row_values=[0.02, 0.10],
+            col_values=[0.025, 0.03],
+            results=[[nan, nan], [120, 150]]
+        )
+
+        assert table.range() == (120, 150)
+        assert table.min_value() == 120
+        assert table.max_value() == 150
+
     def test_to_dict(self):
         """Test serialization to dictionary."""
         table = SensitivityTable(
@@ -104,6 +121,99 @@ class TestSensitivityAnalysis:
         assert table.results[0][1] == 2.0  # 10 / 5
         assert table.results[1][2] == 2.0  # 20 / 10
 
+    def test_create_table_vectorized(self):
+        """Test one grid call matches the per-cell loop."""
+        calls = []
+
+        def calc_func(x, y):
+            calls.append(1)
+            return x / y
+
+        kwargs = dict(row_variable="X", col_variable="Y",
+                      row_values=[10.0, 20.0, 30.0], col_values=[4.0, 5.0])
+        table = SensitivityAnalysis.create_table(calc_func, vectorized=True,
+                                                 **kwargs)
+
+        assert len(calls) == 1
+        assert table.results == SensitivityAnalysis.create_table(
+            calc_func, **kwargs
+        ).results
+
+    def test_create_table_vectorized_falls_back(self):
+        """Test scalar-only functions still work with vectorized=True."""
+        def calc_func(x, y):
+            if y == 0:  # ambiguous for arrays, raises
+                raise ValueError("Division by zero")
+            return x / y
+
+        table = SensitivityAnalysis.create_table(
+            calc_func=calc_func,
+            row_variable="X",
+            col_variable="Y",
+            row_values=[10, 20],
+            col_values=[0, 5],
+            vectorized=True
+        )
+
+        assert table.results[0][0] != table.results[0][0]
+        assert table.results[1][1] == 4.0
+
+    def test_dcf_sensitivity_leaves_model_unchanged(self):
+        """Test DCF sensitivity values each cell without mutating the model."""
+        dcf = DCFModel(
+            projections=[
+                UFCFProjection(year=1, revenue=1000, ebit=200, tax_rate=0.25,
+                               depreciation_amortization=50, capex=60,
+                               delta_nwc=10),
+                UFCFProjection(year=2, revenue=1100, ebit=220, tax_rate=0.25,
+                               depreciation_amortization=55, capex=65,
+                               delta_nwc=10),
+            ],
+            wacc=0.10,
+            terminal_growth=0.025
+        )
+
+        table = SensitivityAnalysis.dcf_sensitivity(
+            dcf, wacc_range=[0.02, 0.10], growth_range=[0.025, 0.03]
+        )
+
+        assert dcf.wacc == 0.10 and dcf.terminal_growth == 0.025
+        assert table.base_row_idx == 1 and table.base_col_idx == 0
+        assert table.results[0][0] != table.results[0][0]  # WACC <= g
+        assert table.results[1][0] == pytest.approx(
+            dcf.value_perpetuity_method().enterprise_value, rel=1e-12
+        )
+        assert table.results[1][1] == pytest.approx(
+            dcf.value_perpetuity_method(terminal_growth=0.03).enterprise_value,
+            rel=1e-12
+        )
+
+        dcf.precision = "exact"
+        exact = SensitivityAnalysis.dcf_sensitivity(
+            dcf, wacc_range=[0.02, 0.10], growth_range=[0.025, 0.03]
+        )
+        assert exact.results[1] == pytest.approx(table.results[1], rel=1e-12)
+
+    def test_lbo_sensitivity_leaves_model_unchanged(self):
+        """Test LBO sensitivity matches per-cell overrides without mutation."""
+        lbo = LBOModel.simple_lbo(
+            entry_ebitda=100, entry_multiple=10.0, leverage_turns=5.0,
+            interest_rate=0.08, exit_multiple=10.0
+        )
+
+        table = SensitivityAnalysis.lbo_sensitivity(
+            lbo, entry_multiples=[8.0, 10.0], exit_multiples=[9.0, 10.0, 12.0]
+        )
+
+        assert lbo.entry_multiple == 10.0 and lbo.exit_multiple == 10.0
+        assert table.base_row_idx == 1 and table.base_col_idx == 1
+        assert table.results[1][1] == pytest.approx(lbo.run_model().irr,
+                                                    rel=1e-12)
+        assert table.results[0][2] == pytest.approx(
+            lbo.run_model(entry_multiple=8.0, exit_multiple=12.0).irr,
+            rel=1e-12
+        )
+
 
 class TestFootballField:
     """Tests for Football Field visualization."""
@@ -1,11 +1,13 @@
 """Tests for utility functions."""
 
+import numpy as np
 import pytest
 from company_valuation.utils import (
-    treasury_stock_method, diluted_shares, OptionGrant,
+    treasury_stock_method, treasury_stock_method_arrays, diluted_shares,
+    OptionGrant,
     enterprise_value, equity_value_from_ev, net_debt,
     ltm_calculation, implied_perpetual_growth, rule_of_40,
-    ev_to_equity_bridge
+    ev_to_equity_bridge, calculate_statistics, _statistics_rows
 )
 
 
@@ -64,6 +66,31 @@ class TestTreasuryStockMethod:
         dilution = treasury_stock_method(options, current_price=0)
         assert dilution == 0
 
+    def test_arrays_match_grants(self):
+        """Test the array form matches the per-grant calculation."""
+        rng = np.random.default_rng(3)
+        quantities = rng.uniform(10, 1000, 500)
+        strikes = rng.uniform(20, 150, 500)
+        options = [OptionGrant(quantity=q, strike_price=k)
+                   for q, k in zip(quantities.tolist(), strikes.tolist())]
+
+        assert treasury_stock_method_arrays(quantities, strikes, 100) == \
+            pytest.approx(treasury_stock_method(options, 100), rel=1e-12)
+        assert treasury_stock_method_arrays(quantities, strikes, 0) == 0.0
+
+    def test_large_cap_table(self):
+        """Test a large cap table matches the per-grant sum."""
+        options = [OptionGrant(quantity=100 + i, strike_price=10.0 + i % 50)
+                   for i in range(500)]
+        expected = sum(
+            max(0, o.quantity - o.quantity * o.strike_price / 40.0)
+            for o in options if o.strike_price < 40.0
+        )
+
+        assert treasury_stock_method(options, 40.0) == pytest.approx(
+            expected, rel=1e-12
+        )
+
     def test_diluted_shares(self):
         """Test fully diluted share count."""
         options = [
@@ -125,6 +152,21 @@ class TestEnterpriseValue:
         assert nd == pytest.approx(-300, rel=1e-6)
 
 
+    def test_arrays_element_wise(self):
+        """Test the bridge helpers broadcast over NumPy arrays."""
+        equity = np.array([800.0, 900.0, 1000.0])
+        debt = np.array([300.0, 250.0, 200.0])
+
+        ev = enterprise_value(equity, debt, cash=100.0, minority_interest=20.0)
+
+        assert ev.tolist() == [
+            enterprise_value(e, d, 100.0, 20.0)
+            for e, d in zip(equity.tolist(), debt.tolist())
+        ]
+        assert equity_value_from_ev(ev, debt, 100.0, 20.0).tolist() == \
+            equity.tolist()
+        assert net_debt(debt, 100.0).tolist() == [200.0, 150.0, 100.0]
+
 class TestLTMCalculation:
     """Tests for LTM metric calculation."""
 
@@ -243,3 +285,69 @@ class TestEVToEquityBridge:
         )
 
         assert result["equity_value_per_share"] == 0
+
+
+    def test_bridge_arrays(self):
+        """Test the bridge is element-wise over EV and net debt arrays."""
+        ev = np.array([1000.0, 1200.0])
+
+        result = ev_to_equity_bridge(ev, np.array([200.0, 100.0]), 50.0)
+
+        assert result["equity_value"].tolist() == [800.0, 1100.0]
+        assert result["equity_value_per_share"].tolist() == [16.0, 22.0]
+
+class TestCalculateStatistics:
+    """Tests for descriptive statistics."""
+
+    def test_ignores_nan(self):
+        """Test NaN entries are dropped from array input."""
+        stats = calculate_statistics(np.array([8.0, np.nan, 10.0, 12.0]))
+
+        assert stats["count"] == 3
+        assert stats["median"] == pytest.approx(10.0, rel=1e-6)
+        assert stats["min"] == pytest.approx(8.0, rel=1e-6)
+
+    def test_empty(self):
+        """Test empty and all-NaN input."""
+        assert calculate_statistics([])["median"] is None
+        assert calculate_statistics(np.array([np.nan]))["count"] == 0
+
+    def test_matches_numpy_reductions(self):
+        """Test quantile-derived min/max equal the direct reductions."""
+        values = np.random.default_rng(0).normal(10.0, 3.0, 101)
+        stats = calculate_statistics(values)
+
+        assert stats["min"] == values.min()
+        assert stats["max"] == values.max()
+        assert stats["p25"] == pytest.approx(np.percentile(values, 25), rel=1e-12)
+        assert stats["mean"] == pytest.approx(values.mean(), rel=1e-12)
+
+    def test_small_sample_path(self):
+        """Test the pure-Python path for small samples matches NumPy."""
+        values = np.random.default_rng(2).normal(10.0, 3.0, 12)
+        values[3] = np.nan
+        valid = values[~np.isnan(values)]
+        stats = calculate_statistics(values)
+
+        assert stats["count"] == 11
+        assert stats["min"] == valid.min()
+        assert stats["max"] == valid.max()
+        assert [stats["p25"], stats["median"], stats["p75"]] == \
+            np.quantile(valid, [0.25, 0.5, 0.75]).tolist()
+        assert stats["mean"] == pytest.approx(valid.mean(), rel=1e-12)
+
+    def test_rows_match_single(self):
+        """Test batched row statistics match calculate_statistics per row."""
+        rng = np.random.default_rng(1)
+        matrix = rng.normal(10.0, 3.0, (4, 25))
+        matrix[rng.random(matrix.shape) < 0.3] = np.nan
+        matrix[0] = np.nan
+
+        stats = _statistics_rows(matrix)
+
+        assert stats[0] == calculate_statistics([])
+        for row, row_stats in zip(matrix[1:], stats[1:]):
+            expected = calculate_statistics(row)
+            assert row_stats.pop("mean") == pytest.approx(expected.pop("mean"),
+                                                          rel=1e-12)
+            assert row_stats == expected
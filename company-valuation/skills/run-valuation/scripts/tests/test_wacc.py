@@ -1,5 +1,6 @@
 """Tests for WACC and CAPM calculations."""
 
+import numpy as np
 import pytest
 from company_valuation.wacc import WACC, CostOfEquity, BetaCalculator
 
@@ -120,6 +121,33 @@ class TestBetaCalculator:
         assert target_beta > 0
         assert target_beta < 3.0
 
+    def test_from_peers_large_group_matches_scalar(self):
+        """Test a large peer group matches unlever/relever per peer."""
+        peer_betas = [0.8 + 0.002 * i for i in range(200)]
+        peer_debts = [100.0 + 3.0 * i for i in range(200)]
+        peer_equities = [1200.0 - 2.0 * i for i in range(200)]
+
+        unlevered = sorted(
+            BetaCalculator.unlever(b, d, e, 0.25)
+            for b, d, e in zip(peer_betas, peer_debts, peer_equities)
+        )
+        median = (unlevered[99] + unlevered[100]) / 2
+
+        assert BetaCalculator.from_peers(
+            peer_betas, peer_debts, peer_equities, 0.25,
+            target_debt=500, target_equity=800
+        ) == pytest.approx(BetaCalculator.relever(median, 500, 800, 0.25),
+                           rel=1e-12)
+
+        with pytest.raises(ValueError):
+            BetaCalculator.from_peers(peer_betas, peer_debts,
+                                      [0.0] * 200, 0.25, 500, 800)
+
+    def test_from_peers_empty_raises(self):
+        """An empty peer group should raise ValueError."""
+        with pytest.raises(ValueError):
+            BetaCalculator.from_peers([], [], [], 0.25, 500, 800)
+
     def test_zero_equity_raises(self):
         """Zero equity should raise ValueError."""
         with pytest.raises(ValueError):
@@ -174,6 +202,32 @@ class TestWACC:
         assert wacc.debt_weight == pytest.approx(0.3, rel=1e-6)
         assert wacc.total_value == 1000
 
+    def test_edited_inputs_update_wacc(self):
+        """Test calculate() reflects inputs edited after construction."""
+        wacc = WACC(equity_value=600, debt_value=400, cost_of_equity=0.10,
+                    cost_of_debt=0.06, tax_rate=0.25)
+
+        wacc.cost_of_equity = 0.12
+        wacc.debt_value = 0
+
+        assert not hasattr(wacc, "__dict__")
+        assert wacc.debt_weight == 0
+        assert wacc.calculate() == pytest.approx(0.12, rel=1e-12)
+
+    def test_calculate_batch_matches_instances(self):
+        """Test the array form matches WACC.calculate point by point."""
+        equity = np.array([600.0, 1000.0, 0.0])
+        debt = np.array([400.0, 0.0, 0.0])
+        cost_of_equity = np.array([[0.09], [0.11]])
+
+        grid = WACC.calculate_batch(equity, debt, cost_of_equity, 0.06, 0.25)
+
+        assert grid.shape == (2, 3)
+        for i, re in enumerate((0.09, 0.11)):
+            for j in range(3):
+                expected = WACC(equity[j], debt[j], re, 0.06, 0.25).calculate()
+                assert grid[i, j] == pytest.approx(expected, rel=1e-12, abs=0)
+
     def test_after_tax_cost_of_debt(self):
         """Test after-tax cost of debt calculation."""
         wacc = WACC(